@@ -0,0 +1,34 @@
+"""
+Ahead-of-time build of the Numba physics kernels
+
+Run once after installing dependencies to skip JIT compilation at startup:
+    python aot_build.py
+The compiled game_physics_aot module is written next to game/physics_numba.py,
+which uses it in preference to the JIT-compiled kernels when present. The
+build records a hash of physics_numba.py, so rerun this after editing it;
+until then the game falls back to the JIT kernels.
+"""
+
+import os
+from numba.pycc import CC
+from game.physics_numba import predict_trajectory_jit, kernel_source_hash
+
+# Source hash checked by physics_numba before it trusts this build
+KERNEL_VERSION = kernel_source_hash()
+
+cc = CC('game_physics_aot')
+cc.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'game')
+
+cc.export(
+    'predict_trajectory',
+    'i8(f8, f8, f8, f8, f8, f8[::1], f8[::1], f8[::1], f8, f8, f8, f8, f8, f8, f8, i8, i8, f4[:,::1])'
+)(predict_trajectory_jit.py_func)
+
+@cc.export('kernel_version', 'i8()')
+def kernel_version():
+    """Source hash of the physics_numba.py these kernels were built from"""
+    return KERNEL_VERSION
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built game_physics_aot in {cc.output_dir}")
@@ -4,10 +4,37 @@ Main game engine - handles game loop, input, and state management
 
 import pygame
 import math
+import random
+import time
+from collections import OrderedDict
+import numpy as np
 from game.physics import PhysicsEngine, Vector2D
+from game.physics_numba import predict_trajectory_nb, warm_up, COMPILED
 from game.objects import Spaceship
+from game.spatial_hash import SpatialHashGrid
+from game.quadtree import Quadtree
 from game.level import LevelManager
 
+# Slingshot power colors indexed by int(power_ratio * 10)
+POWER_LUT = (
+    (0, 255, 100), (0, 255, 100), (0, 255, 100),  # Green for low power
+    (255, 200, 0), (255, 200, 0), (255, 200, 0), (255, 200, 0),  # Yellow for medium power
+    (255, 50, 50), (255, 50, 50), (255, 50, 50), (255, 50, 50),  # Red for high power
+)
+
+# Trajectory gradient steps; a multiple of 4 so each bin has a single dot size
+TRAJECTORY_BINS = 16
+
+# Verlet steps in the trajectory preview at full aim power
+MAX_TRAJ_STEPS = 40
+
+# Most distinct dynamic text surfaces kept by render_text
+TEXT_CACHE_SIZE = 64
+
+# Below this many objects a single vectorized pass beats a broad-phase lookup,
+# for both the collision quadtree and the gravity source grid
+BROAD_PHASE_MIN_OBJECTS = 32
+
 class GameState:
     """Game state enumeration"""
     MENU = 0
@@ -30,8 +57,29 @@ class GameEngine:
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("Gravity Wells - Spaceship Slingshotting Game")
         
+        # Drop events the game never handles before they reach Python; the
+        # mouse position is polled once per frame instead of using MOUSEMOTION
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN,
+                                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                  pygame.WINDOWEXPOSED])
+        self.screen_rect = self.screen.get_rect()
+        # Ships leaving this area (screen plus a 100px margin) are lost
+        self._flight_bounds = self.screen_rect.inflate(200, 200)
+        
+        # Deep space background shared by every level; full redraws and
+        # per-frame erasing restore from this surface
+        self._bg = self.build_background()
+        
+        # Dirty-rect rendering state
+        self._full_redraw = True
+        self._dirty_rects = []
+        self._prev_rects = []
+        
         # Game components
         self.clock = pygame.time.Clock()
+        self.active_fps = 60  # Frame cap while flying or dragging the slingshot
+        self.idle_fps = 30  # Frame cap while waiting for input
         self.physics = PhysicsEngine()
         self.level_manager = LevelManager()
         
@@ -51,30 +99,235 @@ class GameEngine:
         self.aiming_active = False
         self.slingshot_base = Vector2D(0, 0)  # Base position for slingshot
         self.max_slingshot_distance = 120  # Maximum slingshot pull distance
+        self._aim_dist = 0.0  # Clamped pull distance this frame
+        self._aim_dir = (0.0, 0.0)  # Unit launch direction this frame
+        self._arrow_glyphs = {}  # (angle bucket, color) -> rotated aiming arrow
+        
+        # Fixed-step physics
+        self.physics_dt = 1.0 / 120  # Physics step in seconds
+        self.max_frame_time = 0.25  # Longest frame the physics will catch up on
+        self.physics_accumulator = 0.0
         
         # UI settings
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._text_cache = OrderedDict()  # (font id, text, color) -> rendered Surface, LRU order
+        self._static_surfaces = self.build_static_surfaces()
+        
+        # Gravity source arrays shared by flight physics and trajectory
+        # prediction; float64 so the preview matches the real flight
+        self._gravity_x = np.empty(0)
+        self._gravity_y = np.empty(0)
+        self._gravity_m = np.empty(0)
+        self._gravity_grid = None  # Source index grid, only for crowded levels
+        
+        # Collision arrays for the current level (built in load_current_level)
+        self._obj_centers = np.empty((0, 2), dtype=np.float32)
+        self._obj_r2 = np.empty(0, dtype=np.float32)
+        self._goal_idx = -1
+        self._collision_tree = None  # Broad-phase quadtree, only for crowded levels
+        self._collision_bounds = pygame.Rect(0, 0, 0, 0)  # Ship can't hit anything outside this
+        
+        # Per-level object lists (built in load_current_level)
+        self._updatables = []
+        self._pulsers = []
+        self._planets = []
+        self._visible = []  # (object, draw rect) for objects that reach the screen
+        self._gravity_info_surfaces = []  # (surface, position) legend blits
+        
+        # Reused output buffer for trajectory prediction (longest preview is
+        # MAX_TRAJ_STEPS Verlet steps of 0.3s, every stride-th one drawn)
+        self.trajectory_dt = 0.3
+        self.trajectory_stride = 1
+        self._traj_buf = np.empty((-(-MAX_TRAJ_STEPS // self.trajectory_stride), 2), dtype=np.float32)
+        
+        # Last predicted trajectory, keyed by ship position and velocity
+        self._traj_cache_key = None
+        self._traj_cache = None
+        
+        # Pre-rendered trajectory dots, indexed by gradient progress bin
+        self._traj_dots = self.build_trajectory_dots()
+        
+        # Compile physics kernels now rather than on the first aim frame
+        warm_up()
+        
+        # Dispatch tables for per-frame state updates and key presses
+        self._frame_dispatch = {
+            GameState.AIMING: self.update_aiming,
+            GameState.FLYING: self.update_trail,
+        }
+        self._key_dispatch = {
+            pygame.K_r: self.restart_level,
+            pygame.K_n: self.go_to_next_level,
+            pygame.K_p: self.go_to_previous_level,
+            pygame.K_SPACE: self.use_boost,
+            pygame.K_LSHIFT: self.use_brake,
+            pygame.K_RSHIFT: self.use_brake,
+            pygame.K_ESCAPE: self.quit_game,
+        }
         
         # Load first level
         self.load_current_level()
     
+    def build_trajectory_dots(self):
+        """Pre-render (sprite, size) trajectory dots for each gradient progress bin"""
+        dots = []
+        for progress_bin in range(TRAJECTORY_BINS + 1):
+            # Size decreases along trajectory, sampled at the bin's start
+            size = max(1, int(4 * progress_bin / TRAJECTORY_BINS))
+            
+            # Gradient from bright cyan to purple, sampled at the bin's middle
+            progress = min(1.0, (progress_bin + 0.5) / TRAJECTORY_BINS)
+            color = (int(100 + 155 * progress), int(255 * progress), 255)
+            
+            dot = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+            pygame.draw.circle(dot, color, (size, size), size)
+            dots.append((dot.convert_alpha(), size))
+        return dots
+    
+    def render_text(self, font, text, color):
+        """Render text with the given font, reusing the surface if seen before"""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = self.render_surface(font, text, color)
+            cache[key] = surface
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)  # Evict the least recently used
+        else:
+            cache.move_to_end(key)
+        return surface
+    
+    def render_surface(self, font, text, color):
+        """Render antialiased text converted to the display format for fast blits"""
+        return font.render(text, True, color).convert_alpha()
+    
+    def build_static_surfaces(self):
+        """Pre-render the UI messages whose text and color never change"""
+        font, small_font = self.font, self.small_font
+        render = self.render_surface
+        return {
+            'level_complete': render(font, "*** LEVEL COMPLETE! ***", (100, 255, 150)),
+            'next_unlocked': render(small_font,
+                "🎉 New level unlocked! Press N for next level, R to restart", (150, 255, 150)),
+            'all_completed': render(small_font,
+                "🏆 All levels completed! You're a master pilot! Press R to replay", (255, 255, 100)),
+            'mission_failed': render(font, ">>> MISSION FAILED <<<", (255, 100, 100)),
+            'retry': render(small_font, "Press R to restart level", (255, 200, 200)),
+            'aim_hint': render(small_font,
+                ">> Click and drag to aim, then release to launch! <<", (255, 255, 150)),
+            'fly_hint': render(small_font,
+                ">> Spaceship is flying! SPACE=Boost | SHIFT=Brake <<", (255, 255, 100)),
+            'gravity_header': render(small_font, "*** Gravity Types ***", (255, 255, 150)),
+        }
+    
+    def build_background(self):
+        """Render the deep space fill and a faint starfield, once per run"""
+        bg = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        bg.fill((2, 0, 15))  # Deep space purple-black background
+        
+        # Fixed seed so the sky is the same every time
+        rng = random.Random(1337)
+        for _ in range(160):
+            x = rng.randrange(self.screen_width)
+            y = rng.randrange(self.screen_height)
+            brightness = rng.randint(40, 140)
+            color = (brightness, brightness, min(255, brightness + 40))  # Slightly blue
+            if rng.random() < 0.1:
+                pygame.draw.circle(bg, color, (x, y), 1)  # A few larger stars
+            else:
+                bg.set_at((x, y), color)
+        return bg
+    
     def load_current_level(self):
         """Load the current level"""
         self.current_level = self.level_manager.get_current_level()
+        self._traj_cache_key = None
+        self._full_redraw = True
         if self.current_level:
             # Create spaceship at starting position
             start_pos = self.current_level.spaceship_start
-            self.spaceship = Spaceship(start_pos.x, start_pos.y)
+            if self.spaceship is None:
+                self.spaceship = Spaceship(start_pos.x, start_pos.y)
+            else:
+                self.spaceship.reset(start_pos.x, start_pos.y)
             self.state = GameState.AIMING
             
-            # Update objects
-            for obj in self.current_level.objects:
-                if hasattr(obj, 'pulse_timer'):
-                    obj.pulse_timer = 0
+            # Gravity source arrays built with the level (sources don't move)
+            level = self.current_level
+            self._gravity_x, self._gravity_y, self._gravity_m = level.gravity_arrays()
+            self._gravity_grid = self.build_gravity_grid(level)
+            
+            # Cache collision centers and squared contact distances
+            objects = self.current_level.objects
+            self._obj_centers = np.array(
+                [(o.position.x, o.position.y) for o in objects], dtype=np.float32
+            ).reshape(-1, 2)
+            self._obj_r2 = np.array(
+                [(o.radius + self.spaceship.radius) ** 2 for o in objects], dtype=np.float32
+            )
+            goal = self.current_level.goal
+            self._goal_idx = next((i for i, o in enumerate(objects) if o is goal), -1)
+            self._collision_bounds = self.build_collision_bounds(objects)
+            self._collision_tree = self.build_collision_tree(objects)
+            
+            # Objects that animate or pulse, and planets for the gravity legend
+            self._updatables = [o for o in objects if hasattr(o, 'update')]
+            self._pulsers = [o for o in objects if hasattr(o, 'pulse_timer')]
+            self._planets = [o for o in objects if hasattr(o, 'color_type')]
+            
+            # Objects never move, so off-screen ones can be culled once
+            draw_rects = [(o, o.get_draw_rect()) for o in objects]
+            self._visible = [(o, r) for o, r in draw_rects if r.colliderect(self.screen_rect)]
+            self._gravity_info_surfaces = self.build_gravity_info_surfaces()
+            
+            # Restart pulse animations
+            for obj in self._pulsers:
+                obj.pulse_timer = 0
+    
+    def build_collision_bounds(self, objects):
+        """Get the box holding every position where the ship touches an object"""
+        if not objects:
+            return pygame.Rect(0, 0, 0, 0)
+        
+        # Pad by a pixel each side so collidepoint's integer test stays conservative
+        reach = [o.radius + self.spaceship.radius for o in objects]
+        left = math.floor(min(o.position.x - r for o, r in zip(objects, reach))) - 1
+        top = math.floor(min(o.position.y - r for o, r in zip(objects, reach))) - 1
+        right = math.ceil(max(o.position.x + r for o, r in zip(objects, reach))) + 1
+        bottom = math.ceil(max(o.position.y + r for o, r in zip(objects, reach))) + 1
+        return pygame.Rect(left, top, right - left, bottom - top)
+    
+    def build_collision_tree(self, objects):
+        """Build the broad-phase quadtree of object indices, or None for small levels"""
+        if len(objects) < BROAD_PHASE_MIN_OBJECTS:
+            return None
+        
+        # Objects never move, so the tree is only built once per level
+        bounds = self._collision_bounds
+        tree = Quadtree(bounds.left, bounds.top, bounds.right, bounds.bottom)
+        for i, o in enumerate(objects):
+            tree.insert(i, o.position.x, o.position.y, o.radius)
+        return tree
+    
+    def build_gravity_grid(self, level):
+        """Build a grid of gravity source indices, or None for small levels"""
+        if len(level.gs_x) < BROAD_PHASE_MIN_OBJECTS:
+            return None
+        
+        # With cells as wide as gravity's reach, only the 3x3 cells around
+        # the ship can hold sources that pull on it
+        grid = SpatialHashGrid(self.physics.max_gravity_distance)
+        for i, (x, y) in enumerate(zip(level.gs_x.tolist(), level.gs_y.tolist())):
+            grid.insert(i, x, y, 0)
+        return grid
     
     def handle_events(self):
         """Handle all input events"""
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        self.mouse_pos.set(mouse_x, mouse_y)
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -90,57 +343,61 @@ class GameEngine:
                 if event.button == 1:  # Left mouse button
                     self.handle_mouse_up()
             
-            elif event.type == pygame.MOUSEMOTION:
-                self.mouse_pos = Vector2D(event.pos[0], event.pos[1])
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Window contents were lost, so dirty rects aren't enough
+                self._full_redraw = True
     
     def handle_key_press(self, key):
         """Handle keyboard input"""
-        if key == pygame.K_r:
-            # Restart level
-            self.restart_level()
-        
-        elif key == pygame.K_n:
-            # Next level (only if unlocked)
-            if self.level_manager.can_go_to_next_level():
-                if self.level_manager.next_level():
-                    self.load_current_level()
-        
-        elif key == pygame.K_p:
-            # Previous level (only if unlocked)
-            if self.level_manager.can_go_to_previous_level():
-                if self.level_manager.previous_level():
-                    self.load_current_level()
-        
-        elif key == pygame.K_SPACE:
-            # Use thruster (if spaceship is flying)
-            if self.state == GameState.FLYING and self.spaceship.fuel > 0:
-                # Apply small thrust in current velocity direction
-                if self.spaceship.velocity.magnitude() > 0:
-                    thrust_dir = self.spaceship.velocity.normalize()
-                else:
-                    thrust_dir = Vector2D(1, 0)  # Default direction if not moving
-                self.spaceship.use_thruster(thrust_dir, 30)
-        
-        elif key == pygame.K_LSHIFT or key == pygame.K_RSHIFT:
-            # Use brake/slowdown (if spaceship is flying)
-            if self.state == GameState.FLYING and self.spaceship.fuel > 0:
-                # Apply reverse thrust to slow down
-                if self.spaceship.velocity.magnitude() > 0:
-                    brake_dir = self.spaceship.velocity.normalize() * -1  # Opposite direction
-                    self.spaceship.use_thruster(brake_dir, 25)  # Slightly less force than forward thrust
-        
-        elif key == pygame.K_ESCAPE:
-            self.running = False
+        handler = self._key_dispatch.get(key)
+        if handler:
+            handler()
+    
+    def go_to_next_level(self):
+        """Next level (only if unlocked)"""
+        if self.level_manager.can_go_to_next_level():
+            if self.level_manager.next_level():
+                self.load_current_level()
+    
+    def go_to_previous_level(self):
+        """Previous level (only if unlocked)"""
+        if self.level_manager.can_go_to_previous_level():
+            if self.level_manager.previous_level():
+                self.load_current_level()
+    
+    def use_boost(self):
+        """Use thruster (if spaceship is flying)"""
+        if self.state == GameState.FLYING and self.spaceship.fuel > 0:
+            # Apply small thrust in current velocity direction
+            if self.spaceship.velocity.magnitude_sq() > 0:
+                thrust_dir = self.spaceship.velocity.normalize()
+            else:
+                thrust_dir = Vector2D(1, 0)  # Default direction if not moving
+            self.spaceship.use_thruster(thrust_dir, 30)
+    
+    def use_brake(self):
+        """Use brake/slowdown (if spaceship is flying)"""
+        if self.state == GameState.FLYING and self.spaceship.fuel > 0:
+            # Apply reverse thrust to slow down
+            if self.spaceship.velocity.magnitude_sq() > 0:
+                brake_dir = self.spaceship.velocity.normalize() * -1  # Opposite direction
+                self.spaceship.use_thruster(brake_dir, 25)  # Slightly less force than forward thrust
+    
+    def quit_game(self):
+        """Stop the main loop"""
+        self.running = False
     
     def handle_mouse_down(self):
         """Handle mouse button down"""
         if self.state == GameState.AIMING:
             # Check if mouse is near the spaceship to start aiming
-            mouse_to_ship = self.mouse_pos - self.spaceship.position
-            if mouse_to_ship.magnitude() < 50:  # Start aiming if close to spaceship
+            ship_pos = self.spaceship.position
+            dx = self.mouse_pos.x - ship_pos.x
+            dy = self.mouse_pos.y - ship_pos.y
+            if dx * dx + dy * dy < 50 * 50:  # Start aiming if close to spaceship
                 self.aiming_active = True
                 self.mouse_pressed = True
-                self.slingshot_base = Vector2D(self.spaceship.position.x, self.spaceship.position.y)
+                self.slingshot_base.set(ship_pos.x, ship_pos.y)
     
     def handle_mouse_up(self):
         """Handle mouse button up"""
@@ -153,97 +410,157 @@ class GameEngine:
         """Launch the spaceship with calculated velocity from slingshot"""
         if self.spaceship and not self.spaceship.launched:
             # Calculate launch velocity based on slingshot pull
-            slingshot_vector = self.slingshot_base - self.mouse_pos
-            slingshot_distance = min(slingshot_vector.magnitude(), self.max_slingshot_distance)
+            dx = self.slingshot_base.x - self.mouse_pos.x
+            dy = self.slingshot_base.y - self.mouse_pos.y
+            pull_sq = dx * dx + dy * dy
             
-            if slingshot_distance > 10:  # Minimum pull threshold
-                # Launch direction is opposite to pull direction
-                launch_direction = slingshot_vector.normalize()
-                # Power based on how far back the slingshot is pulled
+            if pull_sq > 10 * 10:  # Minimum pull threshold, no sqrt needed
+                # Launch direction is opposite to pull direction, power based
+                # on how far back the slingshot is pulled
+                pull_distance = math.sqrt(pull_sq)
+                slingshot_distance = min(pull_distance, self.max_slingshot_distance)
                 power_factor = slingshot_distance / self.max_slingshot_distance
-                launch_velocity = launch_direction * power_factor * 350  # Adjust base speed as needed
+                speed = power_factor * 350 / pull_distance  # Adjust base speed as needed
                 
-                self.spaceship.launch(launch_velocity)
+                ship = self.spaceship
+                ship.launch(ship.velocity.set(dx * speed, dy * speed))
                 self.state = GameState.FLYING
                 self.current_level.shots_used += 1
     
     def update(self, dt):
-        """Update game state"""
-        if self.state == GameState.AIMING:
-            self.update_aiming()
+        """Update game state: fixed-step physics, then per-frame updates"""
+        self.update_physics(dt)
+        self.update_frame(dt)
+    
+    def update_physics(self, dt):
+        """Advance flight physics in fixed steps, independent of frame rate"""
+        if self.state != GameState.FLYING:
+            self.physics_accumulator = 0.0
+            return
         
-        elif self.state == GameState.FLYING:
-            self.update_flying(dt)
+        # Cap long frames so a stall doesn't trigger a burst of catch-up steps
+        self.physics_accumulator += min(dt, self.max_frame_time)
+        while self.physics_accumulator >= self.physics_dt and self.state == GameState.FLYING:
+            self.update_flying(self.physics_dt)
+            self.physics_accumulator -= self.physics_dt
+    
+    def update_frame(self, dt):
+        """Update aiming, the ship's trail and object animations once per frame"""
+        handler = self._frame_dispatch.get(self.state)
+        if handler:
+            handler(dt)
         
         # Update level objects
         if self.current_level:
-            for obj in self.current_level.objects:
-                if hasattr(obj, 'update'):
-                    obj.update(dt)
+            for obj in self._updatables:
+                obj.update(dt)
     
-    def update_aiming(self):
+    def update_aiming(self, dt=None):
         """Update aiming state with dynamic slingshot"""
         if self.aiming_active and self.spaceship:
-            # Calculate slingshot vector and power
-            slingshot_vector = self.slingshot_base - self.mouse_pos
-            slingshot_distance = min(slingshot_vector.magnitude(), self.max_slingshot_distance)
+            # Calculate slingshot vector and power (single sqrt per frame)
+            dx = self.slingshot_base.x - self.mouse_pos.x
+            dy = self.slingshot_base.y - self.mouse_pos.y
+            pull_distance = math.sqrt(dx * dx + dy * dy)
+            slingshot_distance = min(pull_distance, self.max_slingshot_distance)
+            
+            # Share the pull with draw_slingshot so it doesn't redo the math
+            self._aim_dist = slingshot_distance
+            if pull_distance > 0:
+                self._aim_dir = (dx / pull_distance, dy / pull_distance)
             
             # Constrain mouse position to maximum slingshot distance
-            if slingshot_vector.magnitude() > self.max_slingshot_distance:
-                constrained_direction = slingshot_vector.normalize()
-                constrained_mouse_pos = self.slingshot_base - constrained_direction * self.max_slingshot_distance
-                self.mouse_pos = constrained_mouse_pos
+            if pull_distance > self.max_slingshot_distance:
+                scale = self.max_slingshot_distance / pull_distance
+                self.mouse_pos.set(self.slingshot_base.x - dx * scale,
+                                   self.slingshot_base.y - dy * scale)
             
             # Set spaceship velocity for trajectory prediction
             if slingshot_distance > 10:
-                launch_direction = slingshot_vector.normalize()
                 power_factor = slingshot_distance / self.max_slingshot_distance
-                predicted_velocity = launch_direction * power_factor * 350
-                self.spaceship.velocity = predicted_velocity
+                speed = power_factor * 350 / pull_distance
+                self.spaceship.velocity.set(dx * speed, dy * speed)
                 self.aim_power = power_factor * 3.0  # For visual feedback
             else:
-                self.spaceship.velocity = Vector2D(0, 0)
+                self.spaceship.velocity.set(0, 0)
                 self.aim_power = 0
     
+    def update_trail(self, dt):
+        """Update the flying spaceship's trail once per frame"""
+        self.spaceship.update(dt)
+    
     def update_flying(self, dt):
-        """Update flying state"""
+        """Run one fixed physics step of the flying state"""
         if self.spaceship and self.spaceship.launched:
             # Update spaceship physics
-            self.physics.update_object_physics(
-                self.spaceship, 
-                self.current_level.gravity_sources, 
-                dt
-            )
+            ship = self.spaceship
+            gx, gy, gm = self._gravity_x, self._gravity_y, self._gravity_m
+            
+            # Skip sources outside gravity's reach on crowded levels
+            if self._gravity_grid is not None:
+                nearby = self._gravity_grid.query(
+                    ship.position.x, ship.position.y, self.physics.max_gravity_distance
+                )
+                near = np.array(sorted(nearby), dtype=np.intp)
+                gx, gy, gm = gx[near], gy[near], gm[near]
             
-            # Update spaceship
-            self.spaceship.update(dt)
+            (px, py), (vx, vy) = self.physics.update_object_physics_np(
+                (ship.position.x, ship.position.y),
+                (ship.velocity.x, ship.velocity.y),
+                gx, gy, gm, dt
+            )
+            ship.position.set(px, py)
+            ship.velocity.set(vx, vy)
             
             # Check collisions
             self.check_collisions()
             
-            # Check if spaceship is off screen or moving too slowly
-            if (self.spaceship.position.x < -100 or 
-                self.spaceship.position.x > self.screen_width + 100 or
-                self.spaceship.position.y < -100 or 
-                self.spaceship.position.y > self.screen_height + 100):
+            # Check if spaceship is off screen (one C-level AABB test)
+            position = ship.position
+            if not self._flight_bounds.collidepoint(position.x, position.y):
                 self.reset_for_next_shot()
     
     def check_collisions(self):
         """Check for collisions between spaceship and objects"""
-        if not self.spaceship or not self.spaceship.launched:
+        ship = self.spaceship
+        if not ship or not ship.launched:
             return
         
-        for obj in self.current_level.objects:
-            if self.spaceship.collides_with(obj):
-                if isinstance(obj, type(self.current_level.goal)) and obj == self.current_level.goal:
-                    # Level completed!
-                    self.level_manager.complete_level(self.level_manager.current_level_index)
-                    self.state = GameState.LEVEL_COMPLETE
-                    break
-                else:
-                    # Hit obstacle or planet - reset
-                    self.reset_for_next_shot()
-                    break
+        # Coasting clear of every object - skip the narrow phase entirely
+        position = ship.position
+        if not self._collision_bounds.collidepoint(position.x, position.y):
+            return
+        
+        centers = self._obj_centers
+        contact_r2 = self._obj_r2
+        candidates = None
+        
+        # Narrow crowded levels down to the objects whose boxes overlap the ship's
+        if self._collision_tree is not None:
+            nearby = self._collision_tree.query(position.x, position.y, ship.radius)
+            if not nearby:
+                return
+            candidates = np.array(sorted(nearby))
+            centers = centers[candidates]
+            contact_r2 = contact_r2[candidates]
+        
+        # Squared-distance test against the candidates in one vectorized pass
+        diff = centers - np.array((position.x, position.y), dtype=np.float32)
+        hit = (diff * diff).sum(axis=1) < contact_r2
+        if not hit.any():
+            return
+        
+        # First object hit, matching the original per-object scan order
+        first = np.argmax(hit)
+        if candidates is not None:
+            first = candidates[first]
+        if first == self._goal_idx:
+            # Level completed!
+            self.level_manager.complete_level(self.level_manager.current_level_index)
+            self.state = GameState.LEVEL_COMPLETE
+        else:
+            # Hit obstacle or planet - reset
+            self.reset_for_next_shot()
     
     def reset_for_next_shot(self):
         """Reset spaceship for next shot"""
@@ -252,7 +569,7 @@ class GameEngine:
         else:
             # Reset spaceship
             start_pos = self.current_level.spaceship_start
-            self.spaceship = Spaceship(start_pos.x, start_pos.y)
+            self.spaceship.reset(start_pos.x, start_pos.y)
             self.state = GameState.AIMING
     
     def restart_level(self):
@@ -261,18 +578,27 @@ class GameEngine:
         self.load_current_level()
     
     def draw(self):
-        """Render everything to screen"""
-        # Clear screen with cool space gradient effect
-        self.screen.fill((2, 0, 15))  # Deep space purple-black background
+        """Render everything to screen, pushing only the areas that changed"""
+        if self._full_redraw:
+            # Clear screen with cool space gradient effect
+            self.screen.blit(self._bg, (0, 0))
+        else:
+            # Erase last frame's content by restoring the background under it
+            for rect in self._prev_rects:
+                self.screen.blit(self._bg, rect, rect)
+        self._dirty_rects = []
         
-        # Draw level objects
+        # Draw on-screen level objects, animated off one shared frame time
         if self.current_level:
-            for obj in self.current_level.objects:
-                obj.draw(self.screen)
+            now = time.time()
+            for obj, rect in self._visible:
+                obj.draw(self.screen, now)
+                self._dirty_rects.append(rect)
         
         # Draw spaceship
         if self.spaceship:
             self.spaceship.draw(self.screen)
+            self._dirty_rects.append(self.spaceship.get_draw_rect())
         
         # Draw trajectory prediction when aiming
         if self.state == GameState.AIMING and self.spaceship and self.aim_power > 0.1:
@@ -281,6 +607,11 @@ class GameEngine:
         # Draw slingshot when aiming
         if self.state == GameState.AIMING and self.aiming_active:
             self.draw_slingshot()
+            # Everything in the slingshot stays within the clamped pull distance
+            reach = self.max_slingshot_distance + 10
+            self._dirty_rects.append(pygame.Rect(int(self.slingshot_base.x) - reach,
+                                                 int(self.slingshot_base.y) - reach,
+                                                 reach * 2, reach * 2))
         
         # Draw UI
         self.draw_ui()
@@ -289,98 +620,141 @@ class GameEngine:
         self.draw_gravity_info()
         
         # Update display
-        pygame.display.flip()
+        dirty = [rect.clip(self.screen_rect) for rect in self._dirty_rects]
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._prev_rects + dirty)
+        self._prev_rects = dirty
+    
+    def blit_tracked(self, surface, dest):
+        """Blit a surface onto the screen and mark its area for redraw"""
+        self._dirty_rects.append(self.screen.blit(surface, dest))
     
     def draw_trajectory_prediction(self):
         """Draw predicted trajectory with enhanced visual effects"""
-        if self.spaceship and self.spaceship.velocity.magnitude() > 0:
-            trajectory = self.physics.predict_trajectory(
-                self.spaceship.position,
-                self.spaceship.velocity,
-                self.spaceship.mass,
-                self.current_level.gravity_sources,
-                steps=60,
-                dt=0.15
-            )
+        if self.spaceship and self.spaceship.velocity.magnitude_sq() > 0:
+            ship = self.spaceship
+            key = (ship.position.x, ship.position.y, ship.velocity.x, ship.velocity.y)
             
-            # Draw trajectory with gradient and glow effect
-            for i, point in enumerate(trajectory[::2]):  # Every 2nd point
-                progress = 1.0 - (i / len(trajectory))
+            # Aim unchanged since last frame - reuse the previous prediction
+            if key != self._traj_cache_key:
+                # Longer predictions for stronger shots; the kernel stops
+                # early once the path leaves the flight bounds
+                steps = int(10 + (MAX_TRAJ_STEPS - 10) * self.aim_power / 3.0)
+                stride = self.trajectory_stride
+                bounds = self._flight_bounds
+                if COMPILED:
+                    count = predict_trajectory_nb(
+                        ship.position.x, ship.position.y,
+                        ship.velocity.x, ship.velocity.y,
+                        float(ship.mass),
+                        self._gravity_x, self._gravity_y, self._gravity_m,
+                        self.trajectory_dt,
+                        float(self.physics.gravity_constant),
+                        float(self.physics.max_gravity_distance),
+                        float(bounds.left), float(bounds.top),
+                        float(bounds.right), float(bounds.bottom),
+                        steps, stride, self._traj_buf
+                    )
+                else:
+                    # Without numba the NumPy predictor beats the scalar kernel
+                    count = self.physics.predict_trajectory_np(
+                        (ship.position.x, ship.position.y),
+                        (ship.velocity.x, ship.velocity.y),
+                        self._gravity_x, self._gravity_y, self._gravity_m, self.trajectory_dt,
+                        (bounds.left, bounds.top, bounds.right, bounds.bottom),
+                        steps, stride, self._traj_buf
+                    )
+                trajectory = self._traj_buf[:(count + stride - 1) // stride]
                 
-                # Create gradient from bright cyan to purple
-                color = (
-                    int(100 + 155 * progress),  # Cyan to magenta
-                    int(255 * progress),        # Bright to dim
-                    int(255)                    # Always full blue
-                )
+                # Build the batch of pre-rendered gradient dots
+                blit_seq = []
+                for i, point in enumerate(trajectory):
+                    # Fades to half strength by the end of the prediction
+                    progress = 1.0 - 0.5 * (i * stride / count)
+                    
+                    # Size and color fade along trajectory
+                    dot, size = self._traj_dots[int(progress * TRAJECTORY_BINS)]
+                    blit_seq.append((dot, (int(point[0]) - size, int(point[1]) - size)))
                 
-                # Size decreases along trajectory
-                size = max(1, int(4 * progress))
-                pygame.draw.circle(self.screen, color, (int(point[0]), int(point[1])), size)
+                self._traj_cache_key = key
+                self._traj_cache = blit_seq
+            
+            # Draw trajectory as a single batch
+            self._dirty_rects.extend(self.screen.blits(self._traj_cache))
     
     def draw_slingshot(self):
         """Draw the slingshot aiming mechanism like Angry Birds"""
         if not self.spaceship or not self.aiming_active:
             return
         
-        # Calculate slingshot vectors
-        slingshot_vector = self.slingshot_base - self.mouse_pos
-        slingshot_distance = min(slingshot_vector.magnitude(), self.max_slingshot_distance)
+        # Pull distance and launch direction were computed by update_aiming
+        slingshot_distance = self._aim_dist
         
         if slingshot_distance > 5:
-            # Draw slingshot bands (two lines from base to current mouse position)
-            band_offset = 8  # Offset for the two slingshot bands
-            perpendicular = Vector2D(-slingshot_vector.y, slingshot_vector.x).normalize() * band_offset
-            
-            # Left band
-            left_anchor = self.slingshot_base + perpendicular
-            pygame.draw.line(self.screen, (139, 69, 19),  # Brown color for slingshot
-                           left_anchor.to_tuple(),
-                           self.mouse_pos.to_tuple(), 4)
+            dir_x, dir_y = self._aim_dir
+            base_x, base_y = self.slingshot_base.x, self.slingshot_base.y
+            mouse = (self.mouse_pos.x, self.mouse_pos.y)
             
-            # Right band
-            right_anchor = self.slingshot_base - perpendicular
-            pygame.draw.line(self.screen, (139, 69, 19),
-                           right_anchor.to_tuple(),
-                           self.mouse_pos.to_tuple(), 4)
+            # Draw slingshot bands (left anchor -> mouse -> right anchor)
+            band_offset = 8  # Offset for the two slingshot bands
+            perp_x, perp_y = -dir_y * band_offset, dir_x * band_offset
+            pygame.draw.lines(self.screen, (139, 69, 19), False,  # Brown color for slingshot
+                            [(base_x + perp_x, base_y + perp_y), mouse,
+                             (base_x - perp_x, base_y - perp_y)], 4)
             
             # Draw power indicator with color based on strength
             power_ratio = slingshot_distance / self.max_slingshot_distance
-            if power_ratio < 0.3:
-                power_color = (0, 255, 100)  # Green for low power
-            elif power_ratio < 0.7:
-                power_color = (255, 200, 0)  # Yellow for medium power
-            else:
-                power_color = (255, 50, 50)  # Red for high power
+            power_color = POWER_LUT[int(power_ratio * 10)]
             
-            # Draw aiming line showing launch direction
-            launch_direction = slingshot_vector.normalize()
-            aim_end = self.slingshot_base + launch_direction * 60
-            pygame.draw.line(self.screen, power_color,
-                           self.slingshot_base.to_tuple(),
-                           aim_end.to_tuple(), 3)
-            
-            # Draw arrow head
-            pygame.draw.circle(self.screen, power_color,
-                             (int(aim_end.x), int(aim_end.y)), 4)
+            # Draw aiming arrow showing launch direction
+            glyph, offset_x, offset_y = self.get_arrow_glyph(
+                math.degrees(math.atan2(dir_y, dir_x)), power_color
+            )
+            self.screen.blit(glyph, (int(base_x) + offset_x, int(base_y) + offset_y))
             
             # Draw pull-back indicator at mouse position
             pygame.draw.circle(self.screen, (255, 255, 255),
-                             (int(self.mouse_pos.x), int(self.mouse_pos.y)), 6, 2)
+                             (int(mouse[0]), int(mouse[1])), 6, 2)
             
             # Draw power meter
             power_bar_length = int(power_ratio * 50)
-            power_bar_start = self.slingshot_base + Vector2D(20, -10)
-            power_bar_end = power_bar_start + Vector2D(power_bar_length, 0)
+            bar_x, bar_y = base_x + 20, base_y - 10
             
             # Background of power meter
-            pygame.draw.rect(self.screen, (50, 50, 50),
-                           (power_bar_start.x, power_bar_start.y, 50, 8))
+            pygame.draw.rect(self.screen, (50, 50, 50), (bar_x, bar_y, 50, 8))
             
             # Power meter fill
             if power_bar_length > 0:
                 pygame.draw.rect(self.screen, power_color,
-                               (power_bar_start.x, power_bar_start.y, power_bar_length, 8))
+                               (bar_x, bar_y, power_bar_length, 8))
+    
+    def get_arrow_glyph(self, angle, color):
+        """Get the aiming arrow rotated to angle (degrees, screen coordinates)
+        
+        Returns the cropped glyph and its offset from the slingshot base.
+        Glyphs are cached per color in 2-degree buckets.
+        """
+        bucket = int(round(angle / 2.0)) % 180
+        key = (bucket, color)
+        cached = self._arrow_glyphs.get(key)
+        if cached is None:
+            # Aiming line plus arrow head, pointing right from the center
+            center = 65
+            glyph = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.line(glyph, color, (center, center), (center + 60, center), 3)
+            pygame.draw.circle(glyph, color, (center + 60, center), 4)
+            
+            # pygame rotates counter-clockwise on screen; crop the empty margin
+            rotated = pygame.transform.rotate(glyph, -bucket * 2.0)
+            bounds = rotated.get_bounding_rect()
+            cached = (rotated.subsurface(bounds).convert_alpha(),
+                      bounds.x - rotated.get_width() // 2,
+                      bounds.y - rotated.get_height() // 2)
+            self._arrow_glyphs[key] = cached
+        return cached
     
     def draw_ui(self):
         """Draw enhanced user interface with cool colors and unlock status"""
@@ -395,13 +769,13 @@ class GameEngine:
             else:
                 level_color = (100, 255, 255)  # Bright cyan for current
                 
-            text_surface = self.font.render(level_text, True, level_color)
-            self.screen.blit(text_surface, (10, 10))
+            text_surface = self.render_text(self.font, level_text, level_color)
+            self.blit_tracked(text_surface, (10, 10))
             
             # Progress summary
             progress_text = f"Progress: {progress['completed_count']}/{progress['total']} completed | {progress['unlocked_count']}/{progress['total']} unlocked"
-            progress_surface = self.small_font.render(progress_text, True, (200, 200, 255))
-            self.screen.blit(progress_surface, (10, 40))
+            progress_surface = self.render_text(self.small_font, progress_text, (200, 200, 255))
+            self.blit_tracked(progress_surface, (10, 40))
             
             # Shots info with color coding
             shots_text = f"Shots: {self.current_level.shots_used}/{self.current_level.max_shots}"
@@ -412,8 +786,8 @@ class GameEngine:
             else:
                 shots_color = (100, 255, 100)  # Green when plenty left
             
-            shots_surface = self.small_font.render(shots_text, True, shots_color)
-            self.screen.blit(shots_surface, (10, 70))
+            shots_surface = self.render_text(self.small_font, shots_text, shots_color)
+            self.blit_tracked(shots_surface, (10, 70))
             
             # Fuel info with gradient based on fuel level
             if self.spaceship:
@@ -424,49 +798,40 @@ class GameEngine:
                     100
                 )
                 fuel_text = f"Fuel: {self.spaceship.fuel}/{self.spaceship.max_fuel}"
-                fuel_surface = self.small_font.render(fuel_text, True, fuel_color)
-                self.screen.blit(fuel_surface, (10, 95))
+                fuel_surface = self.render_text(self.small_font, fuel_text, fuel_color)
+                self.blit_tracked(fuel_surface, (10, 95))
         
         # Game state messages with enhanced styling
+        static = self._static_surfaces
         if self.state == GameState.LEVEL_COMPLETE:
-            msg = "*** LEVEL COMPLETE! ***"
-            msg_surface = self.font.render(msg, True, (100, 255, 150))
+            msg_surface = static['level_complete']
             rect = msg_surface.get_rect(center=(self.screen_width//2, self.screen_height//2 - 40))
-            self.screen.blit(msg_surface, rect)
+            self.blit_tracked(msg_surface, rect)
             
             # Show appropriate message based on unlock status
             progress = self.level_manager.get_level_progress()
             if progress['can_go_next']:
-                next_msg = "🎉 New level unlocked! Press N for next level, R to restart"
-                next_color = (150, 255, 150)
+                next_surface = static['next_unlocked']
             else:
-                next_msg = "🏆 All levels completed! You're a master pilot! Press R to replay"
-                next_color = (255, 255, 100)
+                next_surface = static['all_completed']
                 
-            next_surface = self.small_font.render(next_msg, True, next_color)
             next_rect = next_surface.get_rect(center=(self.screen_width//2, self.screen_height//2 - 10))
-            self.screen.blit(next_surface, next_rect)
+            self.blit_tracked(next_surface, next_rect)
         
         elif self.state == GameState.GAME_OVER:
-            msg = ">>> MISSION FAILED <<<"
-            msg_surface = self.font.render(msg, True, (255, 100, 100))
+            msg_surface = static['mission_failed']
             rect = msg_surface.get_rect(center=(self.screen_width//2, self.screen_height//2 - 20))
-            self.screen.blit(msg_surface, rect)
+            self.blit_tracked(msg_surface, rect)
             
-            retry_msg = "Press R to restart level"
-            retry_surface = self.small_font.render(retry_msg, True, (255, 200, 200))
+            retry_surface = static['retry']
             retry_rect = retry_surface.get_rect(center=(self.screen_width//2, self.screen_height//2 + 10))
-            self.screen.blit(retry_surface, retry_rect)
+            self.blit_tracked(retry_surface, retry_rect)
         
         elif self.state == GameState.AIMING:
-            msg = ">> Click and drag to aim, then release to launch! <<"
-            msg_surface = self.small_font.render(msg, True, (255, 255, 150))
-            self.screen.blit(msg_surface, (10, self.screen_height - 30))
+            self.blit_tracked(static['aim_hint'], (10, self.screen_height - 30))
         
         elif self.state == GameState.FLYING:
-            msg = ">> Spaceship is flying! SPACE=Boost | SHIFT=Brake <<"
-            msg_surface = self.small_font.render(msg, True, (255, 255, 100))
-            self.screen.blit(msg_surface, (10, self.screen_height - 30))
+            self.blit_tracked(static['fly_hint'], (10, self.screen_height - 30))
         
         # Navigation controls with unlock status
         progress = self.level_manager.get_level_progress()
@@ -491,62 +856,80 @@ class GameEngine:
         else:
             help_color = (255, 200, 150)  # Orange to indicate restrictions
         
-        help_surface = self.small_font.render(controls_text, True, help_color)
-        self.screen.blit(help_surface, (10, self.screen_height - 60))
+        help_surface = self.render_text(self.small_font, controls_text, help_color)
+        self.blit_tracked(help_surface, (10, self.screen_height - 60))
     
     def draw_gravity_info(self):
         """Draw information about gravity types with enhanced styling"""
         if not self.current_level:
             return
         
-        # Find planets in the level
-        planets = [obj for obj in self.current_level.objects if hasattr(obj, 'color_type')]
-        
-        if planets:
-            info_y = 120  # Adjusted for new UI layout
-            info_text = "*** Gravity Types ***"
-            info_surface = self.small_font.render(info_text, True, (255, 255, 150))
-            self.screen.blit(info_surface, (10, info_y))
-            info_y += 25
-            
-            # Show unique gravity types in this level
-            shown_types = set()
-            for planet in planets:
-                if planet.color_type not in shown_types:
-                    gravity_strength = planet.mass / planet.base_mass
-                    color = planet.color
-                    
-                    # Add symbol based on gravity type
-                    if "Heavy" in planet.color_type:
-                        symbol = "[R]"  # Red
-                    elif "Super Heavy" in planet.color_type:
-                        symbol = "[P]"  # Purple
-                    elif "Light" in planet.color_type:
-                        symbol = "[G]"  # Green
-                    elif "Variable" in planet.color_type:
-                        symbol = "[Y]"  # Yellow
-                    elif "Normal" in planet.color_type:
-                        symbol = "[B]"  # Blue
-                    else:
-                        symbol = "[*]"  # Default
-                    
-                    type_text = f"  {symbol} {planet.color_type}: {gravity_strength:.1f}x"
-                    # Enhance color brightness for better visibility
-                    enhanced_color = (min(255, color[0] + 50), 
-                                    min(255, color[1] + 50), 
-                                    min(255, color[2] + 50))
-                    type_surface = self.small_font.render(type_text, True, enhanced_color)
-                    self.screen.blit(type_surface, (10, info_y))
-                    info_y += 20
-                    shown_types.add(planet.color_type)
+        # Legend is fixed for the level, so it goes out as one batch
+        self._dirty_rects.extend(self.screen.blits(self._gravity_info_surfaces))
+    
+    def build_gravity_info_surfaces(self):
+        """Render the (surface, position) legend blits for each unique planet gravity type"""
+        if not self._planets:
+            return []
+        
+        info_y = 120  # Adjusted for new UI layout
+        blits = [(self._static_surfaces['gravity_header'], (10, info_y))]
+        info_y += 25
+        
+        # Show unique gravity types in this level
+        shown_types = set()
+        for planet in self._planets:
+            if planet.color_type not in shown_types:
+                gravity_strength = planet.mass / planet.base_mass
+                color = planet.color
+                
+                # Add symbol based on gravity type
+                if "Heavy" in planet.color_type:
+                    symbol = "[R]"  # Red
+                elif "Super Heavy" in planet.color_type:
+                    symbol = "[P]"  # Purple
+                elif "Light" in planet.color_type:
+                    symbol = "[G]"  # Green
+                elif "Variable" in planet.color_type:
+                    symbol = "[Y]"  # Yellow
+                elif "Normal" in planet.color_type:
+                    symbol = "[B]"  # Blue
+                else:
+                    symbol = "[*]"  # Default
+                
+                type_text = f"  {symbol} {planet.color_type}: {gravity_strength:.1f}x"
+                # Enhance color brightness for better visibility
+                enhanced_color = (min(255, color[0] + 50), 
+                                min(255, color[1] + 50), 
+                                min(255, color[2] + 50))
+                blits.append((self.render_surface(self.small_font, type_text, enhanced_color),
+                              (10, info_y)))
+                info_y += 20
+                shown_types.add(planet.color_type)
+        return blits
 
     def run(self):
         """Main game loop"""
+        # Bind hot methods once instead of looking them up every iteration
+        tick = self.clock.tick
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        
+        get_active = pygame.display.get_active
+        
         while self.running:
-            dt = self.clock.tick(60) / 1000.0  # Delta time in seconds
+            # Only flight and aiming need the full frame rate
+            busy = self.state == GameState.FLYING or self.aiming_active
+            dt = tick(self.active_fps if busy else self.idle_fps) * 0.001  # Delta time in seconds
             
-            self.handle_events()
-            self.update(dt)
-            self.draw()
+            handle_events()
+            update(dt)
+            
+            # Nothing is visible while minimized; repaint fully once restored
+            if get_active():
+                draw()
+            else:
+                self._full_redraw = True
         
         pygame.quit()
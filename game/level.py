@@ -2,18 +2,441 @@
 Level management and loading system
 """
 
+import hashlib
 import json
 import os
+import sys
+import numpy as np
 from game.objects import *
 from game.physics import Vector2D
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    json_loads = orjson.loads  # C parser, accepts bytes directly
+    
+    def json_dumps(obj):
+        """Serialize obj to indented UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    # Fall back to the stdlib parser, which also accepts UTF-8 bytes
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        """Serialize obj to indented UTF-8 JSON bytes"""
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Gravity sign per source kind, for np.take over Level.gs_kind
+KIND_SIGN = np.array(KIND_GRAVITY_SIGN)
+
+# Interned planet colors, so planets sharing a color share one tuple
+_COLOR_CACHE = {}
+
+def user_cache_dir():
+    """Get the per-user directory for the game's regenerable caches"""
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = os.environ["LOCALAPPDATA"]
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gravity-wells")
+
+# Built-in levels, written out by LevelManager.create_default_levels
+_DEFAULT_LEVELS = (
+    {
+        "name": "Tutorial: Color-Based Gravity",
+        "description": "Blue=Normal, Red=Heavy, Green=Light gravity. Use the blue planet!",
+        "max_shots": 3,
+        "spaceship_start": {"x": 100, "y": 300},
+        "objects": [
+            {
+                "type": "planet",
+                "x": 400,
+                "y": 300,
+                "mass": 80,
+                "radius": 25,
+                "color": [50, 50, 255]  # Blue - Normal gravity
+            },
+            {
+                "type": "goal",
+                "x": 700,
+                "y": 300
+            }
+        ]
+    },
+    {
+        "name": "Heavy Red Planet Challenge",
+        "description": "Red planets have 2x gravity! Use the heavy pull to slingshot around.",
+        "max_shots": 2,
+        "spaceship_start": {"x": 100, "y": 400},
+        "objects": [
+            {
+                "type": "planet",
+                "x": 400,
+                "y": 300,
+                "mass": 100,
+                "radius": 35,
+                "color": [255, 30, 30]  # Red - Heavy gravity (2x)
+            },
+            {
+                "type": "goal",
+                "x": 400,
+                "y": 150
+            }
+        ]
+    },
+    {
+        "name": "Anti-Gravity Introduction",
+        "description": "Pink anti-gravity wells push you away! Use them to avoid obstacles.",
+        "max_shots": 3,
+        "spaceship_start": {"x": 100, "y": 300},
+        "objects": [
+            {
+                "type": "obstacle",
+                "x": 350,
+                "y": 300,
+                "radius": 20
+            },
+            {
+                "type": "anti_gravity",
+                "x": 400,
+                "y": 250,
+                "mass": 60
+            },
+            {
+                "type": "planet",
+                "x": 600,
+                "y": 350,
+                "mass": 80,
+                "radius": 25,
+                "color": [50, 255, 50]  # Green - Light gravity
+            },
+            {
+                "type": "goal",
+                "x": 750,
+                "y": 300
+            }
+        ]
+    },
+    {
+        "name": "Black Hole Gauntlet",
+        "description": "Navigate past the deadly black hole! One wrong move and you're space dust.",
+        "max_shots": 2,
+        "spaceship_start": {"x": 100, "y": 500},
+        "objects": [
+            {
+                "type": "black_hole",
+                "x": 400,
+                "y": 300,
+                "mass": 400
+            },
+            {
+                "type": "planet",
+                "x": 250,
+                "y": 200,
+                "mass": 60,
+                "radius": 20,
+                "color": [50, 255, 50]  # Green - Light gravity helper
+            },
+            {
+                "type": "goal",
+                "x": 650,
+                "y": 150
+            }
+        ]
+    },
+    {
+        "name": "Multi-Color Gravity Maze",
+        "description": "Purple=Super Heavy, Yellow=Variable, Green=Light. Navigate the maze!",
+        "max_shots": 4,
+        "spaceship_start": {"x": 50, "y": 300},
+        "objects": [
+            {
+                "type": "planet",
+                "x": 200,
+                "y": 150,
+                "mass": 80,
+                "radius": 28,
+                "color": [200, 50, 200]  # Purple - Super heavy (2.5x)
+            },
+            {
+                "type": "planet",
+                "x": 450,
+                "y": 400,
+                "mass": 90,
+                "radius": 30,
+                "color": [255, 255, 50]  # Yellow - Variable (1.5x)
+            },
+            {
+                "type": "planet",
+                "x": 650,
+                "y": 200,
+                "mass": 100,
+                "radius": 25,
+                "color": [50, 255, 50]  # Green - Light (0.7x)
+            },
+            {
+                "type": "obstacle",
+                "x": 400,
+                "y": 250,
+                "radius": 15
+            },
+            {
+                "type": "goal",
+                "x": 800,
+                "y": 300
+            }
+        ]
+    },
+    {
+        "name": "The Obstacle Course",
+        "description": "Dodge red obstacles while using gravity wells to reach the goal!",
+        "max_shots": 3,
+        "spaceship_start": {"x": 80, "y": 400},
+        "objects": [
+            {
+                "type": "obstacle",
+                "x": 200,
+                "y": 350,
+                "radius": 18
+            },
+            {
+                "type": "obstacle",
+                "x": 350,
+                "y": 250,
+                "radius": 15
+            },
+            {
+                "type": "obstacle",
+                "x": 500,
+                "y": 400,
+                "radius": 20
+            },
+            {
+                "type": "planet",
+                "x": 300,
+                "y": 500,
+                "mass": 100,
+                "radius": 30,
+                "color": [50, 50, 255]  # Blue - Normal gravity
+            },
+            {
+                "type": "anti_gravity",
+                "x": 450,
+                "y": 150,
+                "mass": 70
+            },
+            {
+                "type": "goal",
+                "x": 700,
+                "y": 200
+            }
+        ]
+    },
+    {
+        "name": "Push and Pull Chaos",
+        "description": "Master anti-gravity wells and heavy planets in this chaotic level!",
+        "max_shots": 4,
+        "spaceship_start": {"x": 100, "y": 100},
+        "objects": [
+            {
+                "type": "anti_gravity",
+                "x": 250,
+                "y": 200,
+                "mass": 80
+            },
+            {
+                "type": "planet",
+                "x": 400,
+                "y": 300,
+                "mass": 120,
+                "radius": 35,
+                "color": [255, 30, 30]  # Red - Heavy gravity
+            },
+            {
+                "type": "anti_gravity",
+                "x": 550,
+                "y": 150,
+                "mass": 60
+            },
+            {
+                "type": "planet",
+                "x": 300,
+                "y": 450,
+                "mass": 90,
+                "radius": 25,
+                "color": [255, 255, 50]  # Yellow - Variable gravity
+            },
+            {
+                "type": "obstacle",
+                "x": 450,
+                "y": 200,
+                "radius": 12
+            },
+            {
+                "type": "goal",
+                "x": 750,
+                "y": 400
+            }
+        ]
+    },
+    {
+        "name": "Black Hole Binary System",
+        "description": "Two black holes create extreme gravitational chaos! Expert level only.",
+        "max_shots": 3,
+        "spaceship_start": {"x": 50, "y": 400},
+        "objects": [
+            {
+                "type": "black_hole",
+                "x": 300,
+                "y": 200,
+                "mass": 350
+            },
+            {
+                "type": "black_hole",
+                "x": 500,
+                "y": 400,
+                "mass": 350
+            },
+            {
+                "type": "planet",
+                "x": 150,
+                "y": 250,
+                "mass": 60,
+                "radius": 20,
+                "color": [50, 255, 50]  # Green - Light gravity escape helper
+            },
+            {
+                "type": "anti_gravity",
+                "x": 650,
+                "y": 300,
+                "mass": 100
+            },
+            {
+                "type": "goal",
+                "x": 800,
+                "y": 100
+            }
+        ]
+    },
+    {
+        "name": "The Final Challenge",
+        "description": "Everything you've learned! All object types in one epic level.",
+        "max_shots": 5,
+        "spaceship_start": {"x": 80, "y": 500},
+        "objects": [
+            {
+                "type": "planet",
+                "x": 200,
+                "y": 400,
+                "mass": 100,
+                "radius": 30,
+                "color": [200, 50, 200]  # Purple - Super heavy
+            },
+            {
+                "type": "obstacle",
+                "x": 300,
+                "y": 300,
+                "radius": 18
+            },
+            {
+                "type": "anti_gravity",
+                "x": 400,
+                "y": 200,
+                "mass": 80
+            },
+            {
+                "type": "black_hole",
+                "x": 500,
+                "y": 350,
+                "mass": 400
+            },
+            {
+                "type": "planet",
+                "x": 350,
+                "y": 500,
+                "mass": 70,
+                "radius": 22,
+                "color": [50, 255, 50]  # Green - Light gravity
+            },
+            {
+                "type": "obstacle",
+                "x": 600,
+                "y": 250,
+                "radius": 15
+            },
+            {
+                "type": "planet",
+                "x": 700,
+                "y": 400,
+                "mass": 90,
+                "radius": 28,
+                "color": [255, 30, 30]  # Red - Heavy gravity
+            },
+            {
+                "type": "anti_gravity",
+                "x": 750,
+                "y": 150,
+                "mass": 60
+            },
+            {
+                "type": "goal",
+                "x": 850,
+                "y": 300
+            }
+        ]
+    }
+)
+
+def _make_planet(obj_data):
+    """Build a Planet from its level data"""
+    get = obj_data.get
+    color = tuple(get("color", [100, 100, 200]))
+    color = _COLOR_CACHE.setdefault(color, color)
+    return Planet(get("x", 0), get("y", 0), get("mass", 100), get("radius", 30), color)
+
+def _make_black_hole(obj_data):
+    """Build a BlackHole from its level data"""
+    get = obj_data.get
+    return BlackHole(get("x", 0), get("y", 0), get("mass", 200))
+
+def _make_anti_gravity(obj_data):
+    """Build an AntiGravityWell from its level data"""
+    get = obj_data.get
+    return AntiGravityWell(get("x", 0), get("y", 0), get("mass", 50))
+
+def _make_goal(obj_data):
+    """Build a Goal from its level data"""
+    get = obj_data.get
+    return Goal(get("x", 0), get("y", 0))
+
+def _make_obstacle(obj_data):
+    """Build an Obstacle from its level data"""
+    get = obj_data.get
+    return Obstacle(get("x", 0), get("y", 0), get("radius", 15))
+
 class Level:
     """Represents a single game level"""
     
+    __slots__ = ('spaceship_start', 'objects', 'gravity_sources', 'goal', 'name',
+                 'description', 'max_shots', 'shots_used',
+                 'gs_x', 'gs_y', 'gs_mass', 'gs_kind', 'gs_signed_mass', '_resettable')
+    
+    # Object "type" field -> factory building it from its data dictionary
+    _FACTORIES = {
+        "planet": _make_planet,
+        "black_hole": _make_black_hole,
+        "anti_gravity": _make_anti_gravity,
+        "goal": _make_goal,
+        "obstacle": _make_obstacle,
+    }
+    
     def __init__(self, level_data=None):
         self.spaceship_start = Vector2D(100, 300)
         self.objects = []
         self.gravity_sources = []
+        self._resettable = []  # Objects with an active flag to restore on reset
+        self.build_gravity_arrays()
         self.goal = None
         self.name = "Untitled Level"
         self.description = "Complete the level by reaching the goal!"
@@ -25,116 +448,237 @@ class Level:
     
     def load_from_data(self, data):
         """Load level from dictionary data"""
-        self.name = data.get("name", "Untitled Level")
-        self.description = data.get("description", "")
-        self.max_shots = data.get("max_shots", 3)
+        get = data.get
+        self.name = get("name", "Untitled Level")
+        self.description = get("description", "")
+        self.max_shots = get("max_shots", 3)
         
         # Load spaceship starting position
-        start_pos = data.get("spaceship_start", {"x": 100, "y": 300})
+        start_pos = get("spaceship_start") or {"x": 100, "y": 300}
         self.spaceship_start = Vector2D(start_pos["x"], start_pos["y"])
         
         # Load objects
-        self.objects = []
-        self.gravity_sources = []
+        self.objects = objects = []
+        self.gravity_sources = gravity_sources = []
+        create_object = self.create_object_from_data
         
-        for obj_data in data.get("objects", []):
-            obj = self.create_object_from_data(obj_data)
+        for obj_data in get("objects", []):
+            obj = create_object(obj_data)
             if obj:
-                self.objects.append(obj)
+                objects.append(obj)
                 
                 # Add to gravity sources if it has gravitational effect
-                if hasattr(obj, 'mass') and obj.mass > 0:
-                    self.gravity_sources.append(obj)
+                if getattr(obj, 'mass', 0) > 0:
+                    gravity_sources.append(obj)
                 
                 # Set goal reference
                 if isinstance(obj, Goal):
                     self.goal = obj
+        
+        self._resettable = [obj for obj in objects if hasattr(obj, 'active')]
+        self.build_gravity_arrays()
+    
+    def build_gravity_arrays(self):
+        """Mirror gravity_sources as parallel arrays for vectorized physics
+        
+        gs_x/gs_y/gs_mass are float64 so previews match the flight physics;
+        gs_kind holds each source's KIND, mapping to a sign via KIND_SIGN.
+        gs_signed_mass is gs_mass with that sign applied, negative for
+        anti-gravity sources.
+        """
+        sources = self.gravity_sources
+        n = len(sources)
+        self.gs_x = np.empty(n, dtype=np.float64)
+        self.gs_y = np.empty(n, dtype=np.float64)
+        self.gs_mass = np.empty(n, dtype=np.float64)
+        self.gs_kind = np.empty(n, dtype=np.int8)
+        for i, source in enumerate(sources):
+            self.gs_x[i] = source.position.x
+            self.gs_y[i] = source.position.y
+            self.gs_mass[i] = source.mass
+            self.gs_kind[i] = source.KIND
+        self.gs_signed_mass = self.gs_mass * KIND_SIGN[self.gs_kind]
+    
+    def gravity_arrays(self):
+        """Get the (gx, gy, gm) source arrays taken by the physics methods"""
+        return self.gs_x, self.gs_y, self.gs_signed_mass
     
     def create_object_from_data(self, obj_data):
         """Create game object from data dictionary"""
-        obj_type = obj_data.get("type")
-        x = obj_data.get("x", 0)
-        y = obj_data.get("y", 0)
-        
-        if obj_type == "planet":
-            mass = obj_data.get("mass", 100)
-            radius = obj_data.get("radius", 30)
-            color = obj_data.get("color", [100, 100, 200])
-            return Planet(x, y, mass, radius, tuple(color))
-        
-        elif obj_type == "black_hole":
-            mass = obj_data.get("mass", 200)
-            return BlackHole(x, y, mass)
-        
-        elif obj_type == "anti_gravity":
-            mass = obj_data.get("mass", 50)
-            return AntiGravityWell(x, y, mass)
-        
-        elif obj_type == "goal":
-            return Goal(x, y)
-        
-        elif obj_type == "obstacle":
-            radius = obj_data.get("radius", 15)
-            return Obstacle(x, y, radius)
-        
-        return None
+        factory = self._FACTORIES.get(obj_data.get("type"))
+        return factory(obj_data) if factory else None
     
     def reset(self):
         """Reset level state"""
         self.shots_used = 0
         
         # Reset all objects to initial state
-        for obj in self.objects:
-            if hasattr(obj, 'active'):
-                obj.active = True
+        for obj in self._resettable:
+            obj.active = True
 
 class LevelManager:
     """Manages level loading and progression"""
     
     def __init__(self):
         self.levels = []
+        self._level_sources = []
+        self._level_names = []
         self.current_level_index = 0
         self.levels_dir = "levels"
+        
+        # Generated per user, outside the levels directory where every *.json is a level
+        levels_key = hashlib.sha1(os.path.abspath(self.levels_dir).encode('utf-8')).hexdigest()[:16]
+        self.packed_file = os.path.join(user_cache_dir(), f"levels-{levels_key}.json")  # All levels in one file
+        
         self.progress_file = "progress.json"
         self.completed_levels = set()  # Set of completed level indices
         self.unlocked_levels = {0}  # Set of unlocked level indices (level 0 always unlocked)
+        self._loaded = False  # Whether load_all_levels has already run
         
         self.load_progress()
         self.load_all_levels()
         self.update_unlocked_levels()
     
     def load_all_levels(self):
-        """Load all available levels"""
+        """Find and parse all available levels; each Level is built on first use"""
+        # The levels directory is only scanned once
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        # levels holds built Level objects, None until each is first used
+        self.levels = []
+        self._level_sources = []  # Parsed data of each level not built yet
+        self._level_names = []  # Level file names, for error messages
+        
         # Create default levels if no level files exist
         if not os.path.exists(self.levels_dir):
             os.makedirs(self.levels_dir)
-            self.create_default_levels()
+            level_files = self.create_default_levels()
+            
+            # Build them straight from memory rather than re-reading the files
+            self.set_level_sources(level_files, _DEFAULT_LEVELS)
+            return
         
-        # Load levels from files
-        self.levels = []
-        for filename in sorted(os.listdir(self.levels_dir)):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.levels_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        level_data = json.load(f)
-                        level = Level(level_data)
-                        self.levels.append(level)
-                except Exception as e:
-                    print(f"Error loading level {filename}: {e}")
+        # Load levels from the packed file in one parse when it's up to date
+        level_files, mtimes = self.scan_level_files()
+        levels_data = self.load_packed_levels(level_files, mtimes)
+        if levels_data is None:
+            # Parse the level files once and pack them for the next start
+            levels_data = self.parse_level_files(level_files)
+            if level_files and all(level_data is not None for level_data in levels_data):
+                self.save_packed_levels(level_files, levels_data)
+        self.set_level_sources(level_files, levels_data)
         
         # Ensure we have at least one level
         if not self.levels:
             self.levels.append(self.create_tutorial_level())
+            self._level_sources.append(None)
+            self._level_names.append("tutorial")
+    
+    def set_level_sources(self, level_files, levels_data):
+        """Use levels_data, parsed from level_files, as the sources of levels built on first use"""
+        self._level_sources = list(levels_data)
+        self._level_names = [os.path.basename(path) for path in level_files]
+        self.levels = [None] * len(self._level_sources)
+    
+    def parse_level_files(self, level_files):
+        """Parse every level file, with None for any file that fails to load"""
+        levels_data = []
+        for path in level_files:
+            try:
+                with open(path, 'rb') as f:
+                    levels_data.append(json_loads(f.read()))
+            except Exception as e:
+                print(f"Error loading level {os.path.basename(path)}: {e}")
+                levels_data.append(None)
+        return levels_data
+    
+    def get_level(self, index):
+        """Get the level at index, building it on first use"""
+        level = self.levels[index]
+        if level is not None:
+            return level
+        
+        level = None
+        level_data = self._level_sources[index]
+        if level_data is not None:
+            try:
+                level = Level(level_data)
+            except Exception as e:
+                # Malformed level data only shows up once the level is built
+                print(f"Error loading level {self._level_names[index]}: {e}")
+        if level is None:
+            # Keep the level numbering intact with a playable stand-in
+            level = self.create_tutorial_level()
+        self.levels[index] = level
+        self._level_sources[index] = None
+        return level
+    
+    def scan_level_files(self):
+        """Scan the levels directory in one pass
+        
+        Returns the sorted paths of the individual level files and a
+        filename -> mtime dict for every file in the directory.
+        """
+        mtimes = {}
+        level_entries = []
+        with os.scandir(self.levels_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                mtimes[entry.name] = entry.stat().st_mtime
+                if entry.name.endswith('.json'):
+                    level_entries.append(entry)
+        level_entries.sort(key=lambda entry: entry.name)
+        return [entry.path for entry in level_entries], mtimes
+    
+    def newest_level_mtime(self, level_files, mtimes):
+        """Get the most recent modification time among the level files"""
+        return max((mtimes[os.path.basename(path)] for path in level_files), default=0.0)
+    
+    def load_packed_levels(self, level_files, mtimes):
+        """Load all level data from the packed file, or None if it's missing or stale"""
+        try:
+            packed_mtime = os.path.getmtime(self.packed_file)
+        except OSError:
+            return None
+        
+        # Stale if any level file was added, removed or edited since packing
+        if self.newest_level_mtime(level_files, mtimes) > packed_mtime:
+            return None
+        
+        try:
+            with open(self.packed_file, 'rb') as f:
+                packed = json_loads(f.read())
+            if packed.get("files") != [os.path.basename(path) for path in level_files]:
+                return None
+            return packed["levels"]
+        except Exception as e:
+            print(f"Error loading packed levels: {e}")
+            return None
+    
+    def save_packed_levels(self, level_files, levels_data):
+        """Save all level data to the packed file, in level file order"""
+        try:
+            packed = {
+                "files": [os.path.basename(path) for path in level_files],
+                "levels": levels_data
+            }
+            os.makedirs(os.path.dirname(self.packed_file), exist_ok=True)
+            with open(self.packed_file, 'wb') as f:
+                f.write(json_dumps(packed))
+        except Exception as e:
+            print(f"Error saving packed levels: {e}")
     
     def load_progress(self):
         """Load player progress from file"""
         if os.path.exists(self.progress_file):
             try:
-                with open(self.progress_file, 'r') as f:
-                    data = json.load(f)
-                    self.completed_levels = set(data.get("completed_levels", []))
-                    self.current_level_index = data.get("current_level_index", 0)
+                with open(self.progress_file, 'rb') as f:
+                    data = json_loads(f.read())
+                self.completed_levels = set(data.get("completed_levels", []))
+                self.current_level_index = data.get("current_level_index", 0)
             except Exception as e:
                 print(f"Error loading progress: {e}")
                 self.completed_levels = set()
@@ -180,358 +724,21 @@ class LevelManager:
         return level_index in self.completed_levels
     
     def create_default_levels(self):
-        """Create default level files with enhanced variety and all object types"""
-        levels_data = [
-            {
-                "name": "Tutorial: Color-Based Gravity",
-                "description": "Blue=Normal, Red=Heavy, Green=Light gravity. Use the blue planet!",
-                "max_shots": 3,
-                "spaceship_start": {"x": 100, "y": 300},
-                "objects": [
-                    {
-                        "type": "planet",
-                        "x": 400,
-                        "y": 300,
-                        "mass": 80,
-                        "radius": 25,
-                        "color": [50, 50, 255]  # Blue - Normal gravity
-                    },
-                    {
-                        "type": "goal",
-                        "x": 700,
-                        "y": 300
-                    }
-                ]
-            },
-            {
-                "name": "Heavy Red Planet Challenge",
-                "description": "Red planets have 2x gravity! Use the heavy pull to slingshot around.",
-                "max_shots": 2,
-                "spaceship_start": {"x": 100, "y": 400},
-                "objects": [
-                    {
-                        "type": "planet",
-                        "x": 400,
-                        "y": 300,
-                        "mass": 100,
-                        "radius": 35,
-                        "color": [255, 30, 30]  # Red - Heavy gravity (2x)
-                    },
-                    {
-                        "type": "goal",
-                        "x": 400,
-                        "y": 150
-                    }
-                ]
-            },
-            {
-                "name": "Anti-Gravity Introduction",
-                "description": "Pink anti-gravity wells push you away! Use them to avoid obstacles.",
-                "max_shots": 3,
-                "spaceship_start": {"x": 100, "y": 300},
-                "objects": [
-                    {
-                        "type": "obstacle",
-                        "x": 350,
-                        "y": 300,
-                        "radius": 20
-                    },
-                    {
-                        "type": "anti_gravity",
-                        "x": 400,
-                        "y": 250,
-                        "mass": 60
-                    },
-                    {
-                        "type": "planet",
-                        "x": 600,
-                        "y": 350,
-                        "mass": 80,
-                        "radius": 25,
-                        "color": [50, 255, 50]  # Green - Light gravity
-                    },
-                    {
-                        "type": "goal",
-                        "x": 750,
-                        "y": 300
-                    }
-                ]
-            },
-            {
-                "name": "Black Hole Gauntlet",
-                "description": "Navigate past the deadly black hole! One wrong move and you're space dust.",
-                "max_shots": 2,
-                "spaceship_start": {"x": 100, "y": 500},
-                "objects": [
-                    {
-                        "type": "black_hole",
-                        "x": 400,
-                        "y": 300,
-                        "mass": 400
-                    },
-                    {
-                        "type": "planet",
-                        "x": 250,
-                        "y": 200,
-                        "mass": 60,
-                        "radius": 20,
-                        "color": [50, 255, 50]  # Green - Light gravity helper
-                    },
-                    {
-                        "type": "goal",
-                        "x": 650,
-                        "y": 150
-                    }
-                ]
-            },
-            {
-                "name": "Multi-Color Gravity Maze",
-                "description": "Purple=Super Heavy, Yellow=Variable, Green=Light. Navigate the maze!",
-                "max_shots": 4,
-                "spaceship_start": {"x": 50, "y": 300},
-                "objects": [
-                    {
-                        "type": "planet",
-                        "x": 200,
-                        "y": 150,
-                        "mass": 80,
-                        "radius": 28,
-                        "color": [200, 50, 200]  # Purple - Super heavy (2.5x)
-                    },
-                    {
-                        "type": "planet",
-                        "x": 450,
-                        "y": 400,
-                        "mass": 90,
-                        "radius": 30,
-                        "color": [255, 255, 50]  # Yellow - Variable (1.5x)
-                    },
-                    {
-                        "type": "planet",
-                        "x": 650,
-                        "y": 200,
-                        "mass": 100,
-                        "radius": 25,
-                        "color": [50, 255, 50]  # Green - Light (0.7x)
-                    },
-                    {
-                        "type": "obstacle",
-                        "x": 400,
-                        "y": 250,
-                        "radius": 15
-                    },
-                    {
-                        "type": "goal",
-                        "x": 800,
-                        "y": 300
-                    }
-                ]
-            },
-            {
-                "name": "The Obstacle Course",
-                "description": "Dodge red obstacles while using gravity wells to reach the goal!",
-                "max_shots": 3,
-                "spaceship_start": {"x": 80, "y": 400},
-                "objects": [
-                    {
-                        "type": "obstacle",
-                        "x": 200,
-                        "y": 350,
-                        "radius": 18
-                    },
-                    {
-                        "type": "obstacle",
-                        "x": 350,
-                        "y": 250,
-                        "radius": 15
-                    },
-                    {
-                        "type": "obstacle",
-                        "x": 500,
-                        "y": 400,
-                        "radius": 20
-                    },
-                    {
-                        "type": "planet",
-                        "x": 300,
-                        "y": 500,
-                        "mass": 100,
-                        "radius": 30,
-                        "color": [50, 50, 255]  # Blue - Normal gravity
-                    },
-                    {
-                        "type": "anti_gravity",
-                        "x": 450,
-                        "y": 150,
-                        "mass": 70
-                    },
-                    {
-                        "type": "goal",
-                        "x": 700,
-                        "y": 200
-                    }
-                ]
-            },
-            {
-                "name": "Push and Pull Chaos",
-                "description": "Master anti-gravity wells and heavy planets in this chaotic level!",
-                "max_shots": 4,
-                "spaceship_start": {"x": 100, "y": 100},
-                "objects": [
-                    {
-                        "type": "anti_gravity",
-                        "x": 250,
-                        "y": 200,
-                        "mass": 80
-                    },
-                    {
-                        "type": "planet",
-                        "x": 400,
-                        "y": 300,
-                        "mass": 120,
-                        "radius": 35,
-                        "color": [255, 30, 30]  # Red - Heavy gravity
-                    },
-                    {
-                        "type": "anti_gravity",
-                        "x": 550,
-                        "y": 150,
-                        "mass": 60
-                    },
-                    {
-                        "type": "planet",
-                        "x": 300,
-                        "y": 450,
-                        "mass": 90,
-                        "radius": 25,
-                        "color": [255, 255, 50]  # Yellow - Variable gravity
-                    },
-                    {
-                        "type": "obstacle",
-                        "x": 450,
-                        "y": 200,
-                        "radius": 12
-                    },
-                    {
-                        "type": "goal",
-                        "x": 750,
-                        "y": 400
-                    }
-                ]
-            },
-            {
-                "name": "Black Hole Binary System",
-                "description": "Two black holes create extreme gravitational chaos! Expert level only.",
-                "max_shots": 3,
-                "spaceship_start": {"x": 50, "y": 400},
-                "objects": [
-                    {
-                        "type": "black_hole",
-                        "x": 300,
-                        "y": 200,
-                        "mass": 350
-                    },
-                    {
-                        "type": "black_hole",
-                        "x": 500,
-                        "y": 400,
-                        "mass": 350
-                    },
-                    {
-                        "type": "planet",
-                        "x": 150,
-                        "y": 250,
-                        "mass": 60,
-                        "radius": 20,
-                        "color": [50, 255, 50]  # Green - Light gravity escape helper
-                    },
-                    {
-                        "type": "anti_gravity",
-                        "x": 650,
-                        "y": 300,
-                        "mass": 100
-                    },
-                    {
-                        "type": "goal",
-                        "x": 800,
-                        "y": 100
-                    }
-                ]
-            },
-            {
-                "name": "The Final Challenge",
-                "description": "Everything you've learned! All object types in one epic level.",
-                "max_shots": 5,
-                "spaceship_start": {"x": 80, "y": 500},
-                "objects": [
-                    {
-                        "type": "planet",
-                        "x": 200,
-                        "y": 400,
-                        "mass": 100,
-                        "radius": 30,
-                        "color": [200, 50, 200]  # Purple - Super heavy
-                    },
-                    {
-                        "type": "obstacle",
-                        "x": 300,
-                        "y": 300,
-                        "radius": 18
-                    },
-                    {
-                        "type": "anti_gravity",
-                        "x": 400,
-                        "y": 200,
-                        "mass": 80
-                    },
-                    {
-                        "type": "black_hole",
-                        "x": 500,
-                        "y": 350,
-                        "mass": 400
-                    },
-                    {
-                        "type": "planet",
-                        "x": 350,
-                        "y": 500,
-                        "mass": 70,
-                        "radius": 22,
-                        "color": [50, 255, 50]  # Green - Light gravity
-                    },
-                    {
-                        "type": "obstacle",
-                        "x": 600,
-                        "y": 250,
-                        "radius": 15
-                    },
-                    {
-                        "type": "planet",
-                        "x": 700,
-                        "y": 400,
-                        "mass": 90,
-                        "radius": 28,
-                        "color": [255, 30, 30]  # Red - Heavy gravity
-                    },
-                    {
-                        "type": "anti_gravity",
-                        "x": 750,
-                        "y": 150,
-                        "mass": 60
-                    },
-                    {
-                        "type": "goal",
-                        "x": 850,
-                        "y": 300
-                    }
-                ]
-            }
-        ]
+        """Create default level files with enhanced variety and all object types
         
-        for i, level_data in enumerate(levels_data):
+        Returns the paths of the written level files.
+        """
+        level_files = []
+        for i, level_data in enumerate(_DEFAULT_LEVELS):
             filename = f"level_{i+1:02d}.json"
             filepath = os.path.join(self.levels_dir, filename)
-            with open(filepath, 'w') as f:
-                json.dump(level_data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(level_data))
+            level_files.append(filepath)
+        
+        # Written last so it's newer than every level file
+        self.save_packed_levels(level_files, list(_DEFAULT_LEVELS))
+        return level_files
     
     def create_tutorial_level(self):
         """Create a simple tutorial level"""
@@ -559,7 +766,7 @@ class LevelManager:
     def get_current_level(self):
         """Get the current level"""
         if 0 <= self.current_level_index < len(self.levels):
-            return self.levels[self.current_level_index]
+            return self.get_level(self.current_level_index)
         return None
     
     def next_level(self):
@@ -598,10 +805,11 @@ class LevelManager:
     
     def get_level_progress(self):
         """Get current level progress info"""
+        current_level = self.get_current_level()
         return {
             "current": self.current_level_index + 1,
             "total": len(self.levels),
-            "name": self.get_current_level().name if self.get_current_level() else "Unknown",
+            "name": current_level.name if current_level else "Unknown",
             "is_completed": self.is_level_completed(self.current_level_index),
             "can_go_next": self.can_go_to_next_level(),
             "can_go_previous": self.can_go_to_previous_level(),
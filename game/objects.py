@@ -4,36 +4,105 @@ Game objects: spaceship, planets, goals, obstacles
 
 import pygame
 import math
+import random
+import time
+from collections import deque
+import numpy as np
 from game.physics import Vector2D
 
+# Gravity kinds, stored per source in Level.gs_kind
+KIND_OBJECT = 0  # Default for bodies without gravity of their own; never a source (mass <= 0)
+KIND_PLANET = 1
+KIND_BLACK_HOLE = 2
+KIND_ANTI_GRAVITY = 3
+
+# Gravity direction for each kind, indexed by KIND
+KIND_GRAVITY_SIGN = (1.0, 1.0, 1.0, -1.0)
+
+# Trail segments are drawn in this many gradient steps, one draw call each
+TRAIL_TIERS = 8
+
+# (color, width) of each trail step, brightening toward cyan at the newest end
+TRAIL_STYLES = tuple(
+    ((int(100 * a), int(255 * a), int(255 * a)), max(1, int(3 * a)))
+    for a in ((tier + 1) / TRAIL_TIERS for tier in range(TRAIL_TIERS))
+)
+
+# Sine and cosine of each whole degree, for angles that don't need finer steps
+SIN_DEG = tuple(math.sin(math.radians(deg)) for deg in range(360))
+COS_DEG = tuple(math.cos(math.radians(deg)) for deg in range(360))
+
+# Most success particles a Goal keeps alive at once
+GOAL_MAX_PARTICLES = 64
+
+# Pre-rendered static layers by (class, sprite_key()), plus the ship glow;
+# kept off the instances so Level objects stay picklable for the level cache
+_SPRITES = {}
+
 class GameObject:
     """Base class for all game objects"""
     
+    KIND = KIND_OBJECT
+    
     def __init__(self, x, y, mass=1.0):
         self.position = Vector2D(x, y)
         self.velocity = Vector2D(0, 0)
         self.mass = mass
         self.radius = 10
+        self.draw_radius = 10  # Outer extent of visual effects, for dirty-rect redraws
         self.color = (255, 255, 255)
         self.active = True
+        self._rect = pygame.Rect(0, 0, 0, 0)  # Reused by get_rect
     
-    def draw(self, screen):
-        """Draw the object on screen"""
+    def draw(self, screen, now=None):
+        """Draw the object on screen
+        
+        now is the frame's time.time(), shared across objects by the caller.
+        """
         if self.active:
             pygame.draw.circle(screen, self.color, 
                              (int(self.position.x), int(self.position.y)), 
                              self.radius)
     
+    def sprite_key(self):
+        """Get the values this object's pre-rendered layers depend on"""
+        return (self.radius, self.color, self.active)
+    
+    def render_sprite(self, surface, center):
+        """Draw this object's unanimated layers onto surface around center"""
+        if self.active:
+            pygame.draw.circle(surface, self.color, center, self.radius)
+    
+    def blit_sprite(self, screen):
+        """Blit the static layers, rendering them on first use"""
+        r = self.radius + 1
+        key = (type(self), self.sprite_key())
+        sprite = _SPRITES.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+            self.render_sprite(sprite, (r, r))
+            sprite = _SPRITES[key] = sprite.convert_alpha()
+        screen.blit(sprite, (int(self.position.x) - r, int(self.position.y) - r))
+    
     def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.position.x - self.radius, 
+        """Get collision rectangle (updated and reused by every call)"""
+        self._rect.update(self.position.x - self.radius, 
                           self.position.y - self.radius,
                           self.radius * 2, self.radius * 2)
+        return self._rect
+    
+    def get_draw_rect(self):
+        """Get the screen area this object's visual effects can cover"""
+        r = self.draw_radius
+        return pygame.Rect(int(self.position.x) - r, int(self.position.y) - r,
+                          r * 2 + 1, r * 2 + 1)
     
     def collides_with(self, other):
         """Check collision with another object"""
-        distance = (self.position - other.position).magnitude()
-        return distance < (self.radius + other.radius)
+        dx = self.position.x - other.position.x
+        dy = self.position.y - other.position.y
+        reach = self.radius + other.radius
+        return dx * dx + dy * dy < reach * reach
 
 class Spaceship(GameObject):
     """Player-controlled spaceship"""
@@ -41,19 +110,28 @@ class Spaceship(GameObject):
     def __init__(self, x, y):
         super().__init__(x, y, mass=1.0)
         self.radius = 8
+        self.draw_radius = self.radius + 7  # Glow plus a pixel of rounding slack
         self.color = (0, 255, 255)  # Bright cyan
         self.fuel = 100
         self.max_fuel = 100
         self.launched = False
-        self.trail = []  # For visual trail
         self.max_trail_length = 50
+        self.trail = deque(maxlen=self.max_trail_length)  # For visual trail, oldest points drop off
         self.glow_color = (100, 255, 255)  # Cyan glow
     
+    def reset(self, x, y):
+        """Return the ship to an unlaunched state at (x, y), reusing this instance"""
+        self.position.set(x, y)
+        self.velocity.set(0, 0)
+        self.fuel = self.max_fuel
+        self.launched = False
+        self.trail.clear()
+    
     def launch(self, velocity):
         """Launch the spaceship with given velocity"""
         self.velocity = velocity
         self.launched = True
-        self.trail = []
+        self.trail.clear()
     
     def use_thruster(self, direction, power=50):
         """Use thruster for course correction"""
@@ -67,28 +145,47 @@ class Spaceship(GameObject):
         if self.launched:
             # Add current position to trail
             self.trail.append((self.position.x, self.position.y))
-            if len(self.trail) > self.max_trail_length:
-                self.trail.pop(0)
+    
+    def get_draw_rect(self):
+        """Get the screen area covered by the ship, its glow, trail and aim arrow"""
+        rect = super().get_draw_rect()
+        
+        if self.trail:
+            xs = [p[0] for p in self.trail]
+            ys = [p[1] for p in self.trail]
+            trail_rect = pygame.Rect(int(min(xs)), int(min(ys)),
+                                     int(max(xs) - min(xs)) + 1, int(max(ys) - min(ys)) + 1)
+            rect.union_ip(trail_rect.inflate(8, 8))
+        
+        if not self.launched and self.velocity.magnitude_sq() > 0:
+            end_x = int(self.position.x + self.velocity.x * 0.1)
+            end_y = int(self.position.y + self.velocity.y * 0.1)
+            rect.union_ip(pygame.Rect(end_x - 5, end_y - 5, 11, 11))
+        
+        return rect
     
     def draw(self, screen):
         """Draw spaceship with enhanced glow effect and trail"""
-        # Draw trail with gradient effect
-        if len(self.trail) > 1:
-            for i in range(1, len(self.trail)):
-                alpha = i / len(self.trail)
-                # Gradient from bright cyan to purple
-                color = (int(100 * alpha), int(255 * alpha), int(255 * alpha))
-                start_pos = self.trail[i-1]
-                end_pos = self.trail[i]
-                # Draw thicker trail segments at the beginning
-                thickness = max(1, int(3 * alpha))
-                pygame.draw.line(screen, color, start_pos, end_pos, thickness)
-        
-        # Draw spaceship glow effect
+        # Draw trail with gradient effect, one polyline per gradient step
+        trail = list(self.trail)  # Snapshot, since deques can't be sliced
+        n = len(trail)
+        if n > 1:
+            for tier, (color, thickness) in enumerate(TRAIL_STYLES):
+                # Segments i (from trail[i-1] to trail[i]) with i / n in this step
+                start = max(1, -(-tier * n // TRAIL_TIERS))
+                end = -(-(tier + 1) * n // TRAIL_TIERS)
+                if start < end:
+                    pygame.draw.lines(screen, color, False, trail[start - 1:end], thickness)
+        
+        # Draw spaceship glow effect, rendered once per size and color
         glow_radius = self.radius + 6
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*self.glow_color, 30), 
-                          (glow_radius, glow_radius), glow_radius)
+        key = ("glow", glow_radius, self.glow_color)
+        glow_surface = _SPRITES.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (*self.glow_color, 30), 
+                              (glow_radius, glow_radius), glow_radius)
+            glow_surface = _SPRITES[key] = glow_surface.convert_alpha()
         screen.blit(glow_surface, 
                    (self.position.x - glow_radius, self.position.y - glow_radius),
                    special_flags=pygame.BLEND_ADD)
@@ -103,7 +200,7 @@ class Spaceship(GameObject):
         # Draw direction indicator if not launched
         if not self.launched:
             # Draw bright arrow pointing in velocity direction
-            if self.velocity.magnitude() > 0:
+            if self.velocity.magnitude_sq() > 0:
                 end_x = self.position.x + self.velocity.x * 0.1
                 end_y = self.position.y + self.velocity.y * 0.1
                 pygame.draw.line(screen, (255, 255, 0), 
@@ -113,172 +210,186 @@ class Spaceship(GameObject):
                 pygame.draw.circle(screen, (255, 255, 100),
                                  (int(end_x), int(end_y)), 3)
 
+# Planet color classes as (test on r, g, b, gravity multiplier, display type),
+# checked in order; colors matching none are Standard with normal gravity
+_COLOR_CLASSES = (
+    (lambda r, g, b: r > 150 and g < 100 and b < 100, 2.0, "Heavy (Red)"),
+    (lambda r, g, b: b > 150 and r < 100 and g < 100, 1.0, "Normal (Blue)"),
+    (lambda r, g, b: g > 150 and r < 100 and b < 100, 0.7, "Light (Green)"),
+    (lambda r, g, b: r > 150 and g > 150 and b < 100, 1.5, "Variable (Yellow)"),
+    (lambda r, g, b: r > 100 and g < 100 and b > 100, 2.5, "Super Heavy (Purple)"),
+    (lambda r, g, b: r > 150 and g > 150 and b > 150, 1.2, "Moderate (White)"),
+)
+
+def classify_color(color):
+    """Get the (gravity multiplier, display type) of a planet color"""
+    r, g, b = color
+    for matches, multiplier, color_type in _COLOR_CLASSES:
+        if matches(r, g, b):
+            return multiplier, color_type
+    return 1.0, "Standard"
+
 class Planet(GameObject):
     """Gravitational body with color-based gravity strength"""
     
+    KIND = KIND_PLANET
+    
     def __init__(self, x, y, mass=100, radius=30, color=(100, 100, 200)):
-        # Calculate effective mass based on color
-        effective_mass = self.calculate_color_based_mass(mass, color)
-        super().__init__(x, y, effective_mass)
+        # Calculate effective mass and display type based on color
+        multiplier, color_type = classify_color(color)
+        super().__init__(x, y, mass * multiplier)
         self.base_mass = mass  # Store original mass
         self.radius = radius
         self.color = color
         self.gravity_field_radius = self.mass * 1.5  # Visual representation based on effective mass
-        self.color_type = self.determine_color_type(color)
+        # Outermost gravity ring is at most 1.15x the field radius
+        self.draw_radius = max(self.radius, int(self.gravity_field_radius * 1.15)) + 2
+        self.color_type = color_type
+        self.ring_styles = self.build_ring_styles()
+    
+    def build_ring_styles(self):
+        """Get the (unpulsed radius, color) of each gravity field ring"""
+        field_color = (self.color[0]//2, self.color[1]//2, self.color[2]//2)
+        
+        # More rings for stronger gravity
+        num_rings = min(int(self.mass / self.base_mass * 3), 6)
+        styles = []
+        for i in range(num_rings):
+            alpha_factor = (num_rings - i) / num_rings
+            ring_color = (int(field_color[0] * alpha_factor * 1.5), 
+                         int(field_color[1] * alpha_factor * 1.5), 
+                         int(field_color[2] * alpha_factor * 1.5))
+            styles.append((self.gravity_field_radius * (0.4 + i * 0.15), ring_color))
+        return tuple(styles)
     
     def calculate_color_based_mass(self, base_mass, color):
         """Calculate effective gravitational mass based on color"""
-        r, g, b = color
-        
-        # Color-based gravity multipliers
-        if r > 150 and g < 100 and b < 100:  # Red planets - Heavy gravity
-            return base_mass * 2.0
-        elif b > 150 and r < 100 and g < 100:  # Blue planets - Normal gravity
-            return base_mass * 1.0
-        elif g > 150 and r < 100 and b < 100:  # Green planets - Light gravity
-            return base_mass * 0.7
-        elif r > 150 and g > 150 and b < 100:  # Yellow planets - Variable gravity
-            return base_mass * 1.5
-        elif r > 100 and g < 100 and b > 100:  # Purple planets - Super heavy
-            return base_mass * 2.5
-        elif r > 150 and g > 150 and b > 150:  # White planets - Moderate gravity
-            return base_mass * 1.2
-        else:  # Default colors get normal gravity
-            return base_mass * 1.0
+        return base_mass * classify_color(color)[0]
     
     def determine_color_type(self, color):
         """Determine the dominant color type for display purposes"""
-        r, g, b = color
-        if r > 150 and g < 100 and b < 100:
-            return "Heavy (Red)"
-        elif b > 150 and r < 100 and g < 100:
-            return "Normal (Blue)"
-        elif g > 150 and r < 100 and b < 100:
-            return "Light (Green)"
-        elif r > 150 and g > 150 and b < 100:
-            return "Variable (Yellow)"
-        elif r > 100 and g < 100 and b > 100:
-            return "Super Heavy (Purple)"
-        elif r > 150 and g > 150 and b > 150:
-            return "Moderate (White)"
-        else:
-            return "Standard"
+        return classify_color(color)[1]
     
-    def draw(self, screen):
+    def draw(self, screen, now=None):
         """Draw planet with enhanced gamey visual effects"""
-        # Draw animated gravity field with pulsing rings
-        field_color = (self.color[0]//2, self.color[1]//2, self.color[2]//2)
+        if now is None:
+            now = time.time()
+        center = (int(self.position.x), int(self.position.y))
         
         # Get gravity strength for visual effects
         gravity_strength = self.mass / self.base_mass
-        num_rings = min(int(gravity_strength * 3), 6)  # More rings for stronger gravity
         
-        # Animated pulsing effect
-        import time
-        pulse = abs(math.sin(time.time() * 2)) * 0.3 + 0.7
+        # Draw animated gravity field with pulsing rings
+        pulse = abs(math.sin(now * 2)) * 0.3 + 0.7
+        for ring_radius, ring_color in self.ring_styles:
+            pygame.draw.circle(screen, ring_color, center, int(ring_radius * pulse), 2)
         
-        for i in range(num_rings):
-            ring_radius = int(self.gravity_field_radius * (0.4 + i * 0.15) * pulse)
-            alpha_factor = (num_rings - i) / num_rings
-            ring_color = (int(field_color[0] * alpha_factor * 1.5), 
-                         int(field_color[1] * alpha_factor * 1.5), 
-                         int(field_color[2] * alpha_factor * 1.5))
-            pygame.draw.circle(screen, ring_color,
-                              (int(self.position.x), int(self.position.y)),
-                              ring_radius, 2)
+        # Draw planet body, plus its glow for normal planets
+        self.blit_sprite(screen)
         
-        # Draw planet with gradient effect
-        super().draw(screen)
-        
-        # Enhanced visual effects based on gravity strength
+        # High-gravity planets get pulsing cores and particle effects
         if gravity_strength > 1.5:
-            # High-gravity planets get pulsing cores and particle effects
-            pulse_intensity = math.sin(time.time() * 4) * 0.2 + 0.8
+            pulse_intensity = math.sin(now * 4) * 0.2 + 0.8
             pulse_radius = max(3, int(self.radius * 0.7 * pulse_intensity))
             pulse_color = (min(255, int(self.color[0] * 1.4)), 
                           min(255, int(self.color[1] * 1.4)), 
                           min(255, int(self.color[2] * 1.4)))
-            pygame.draw.circle(screen, pulse_color,
-                              (int(self.position.x), int(self.position.y)),
-                              pulse_radius)
+            pygame.draw.circle(screen, pulse_color, center, pulse_radius)
             
             # Add bright core for high-gravity planets
-            pygame.draw.circle(screen, (255, 255, 255),
-                              (int(self.position.x), int(self.position.y)), 4)
-        else:
-            # Normal planets get subtle inner glow
-            inner_radius = max(3, self.radius - 8)
-            inner_color = (min(255, self.color[0] + 80), 
-                          min(255, self.color[1] + 80), 
-                          min(255, self.color[2] + 80))
-            pygame.draw.circle(screen, inner_color,
-                              (int(self.position.x), int(self.position.y)),
-                              inner_radius)
-            
-            # Bright center dot
-            pygame.draw.circle(screen, (255, 255, 255),
-                              (int(self.position.x), int(self.position.y)), 2)
+            pygame.draw.circle(screen, (255, 255, 255), center, 4)
+    
+    def sprite_key(self):
+        """Get the values this planet's pre-rendered layers depend on"""
+        return super().sprite_key() + (self.mass / self.base_mass > 1.5,)
+    
+    def render_sprite(self, surface, center):
+        """Draw the planet body, and the inner glow of normal planets"""
+        super().render_sprite(surface, center)
+        if self.mass / self.base_mass > 1.5:
+            return
+        
+        # Normal planets get subtle inner glow
+        inner_radius = max(3, self.radius - 8)
+        inner_color = (min(255, self.color[0] + 80), 
+                      min(255, self.color[1] + 80), 
+                      min(255, self.color[2] + 80))
+        pygame.draw.circle(surface, inner_color, center, inner_radius)
+        
+        # Bright center dot
+        pygame.draw.circle(surface, (255, 255, 255), center, 2)
 
 class BlackHole(GameObject):
     """Deadly gravitational body with extreme gravity and cool effects"""
     
+    KIND = KIND_BLACK_HOLE
+    
     def __init__(self, x, y, mass=500):  # Increased mass for stronger gravity
         super().__init__(x, y, mass)
         self.radius = 15
         self.color = (20, 0, 40)  # Deep purple
         self.event_horizon = 30
         self.accretion_disk_radius = 45
+        self.draw_radius = self.accretion_disk_radius + 8
     
-    def draw(self, screen):
+    def draw(self, screen, now=None):
         """Draw black hole with dramatic visual effects"""
-        import time
+        if now is None:
+            now = time.time()
+        center = (int(self.position.x), int(self.position.y))
         
         # Draw accretion disk with spinning effect
-        spin_offset = time.time() * 5
+        sin, circle = math.sin, pygame.draw.circle
+        x, y = self.position.x, self.position.y
+        spin_offset = now * 5
+        spin_deg = int(spin_offset)
         for i in range(8):
-            angle = (i * 45 + spin_offset) * math.pi / 180
-            disk_radius = self.accretion_disk_radius + math.sin(spin_offset + i) * 5
-            x_offset = math.cos(angle) * disk_radius * 0.7
-            y_offset = math.sin(angle) * disk_radius * 0.3  # Flatten to look like disk
+            angle = (i * 45 + spin_deg) % 360
+            wave = sin(spin_offset + i)
+            disk_radius = self.accretion_disk_radius + wave * 5
+            x_offset = COS_DEG[angle] * disk_radius * 0.7
+            y_offset = SIN_DEG[angle] * disk_radius * 0.3  # Flatten to look like disk
             
             # Gradient colors from orange to red
-            intensity = (math.sin(spin_offset + i) + 1) / 2
+            intensity = (wave + 1) / 2
             color = (int(255 * intensity), int(100 * intensity), int(20 * intensity))
             
-            pygame.draw.circle(screen, color,
-                              (int(self.position.x + x_offset), int(self.position.y + y_offset)), 3)
+            circle(screen, color, (int(x + x_offset), int(y + y_offset)), 3)
         
         # Draw event horizon with pulsing danger effect
-        pulse = abs(math.sin(time.time() * 3)) * 0.3 + 0.7
+        pulse = abs(math.sin(now * 3)) * 0.3 + 0.7
         horizon_color = (int(150 * pulse), 0, int(200 * pulse))
-        pygame.draw.circle(screen, horizon_color,
-                          (int(self.position.x), int(self.position.y)),
-                          int(self.event_horizon * pulse), 3)
+        pygame.draw.circle(screen, horizon_color, center, int(self.event_horizon * pulse), 3)
         
         # Draw the black hole itself
-        pygame.draw.circle(screen, self.color,
-                          (int(self.position.x), int(self.position.y)), self.radius)
-        
-        # Draw ultra-dark center
-        pygame.draw.circle(screen, (0, 0, 0),
-                          (int(self.position.x), int(self.position.y)), self.radius - 5)
+        self.blit_sprite(screen)
+    
+    def render_sprite(self, surface, center):
+        """Draw the black hole body and its ultra-dark center"""
+        pygame.draw.circle(surface, self.color, center, self.radius)
+        pygame.draw.circle(surface, (0, 0, 0), center, self.radius - 5)
 
 class AntiGravityWell(GameObject):
     """Repulsive gravitational body with cool energy effects"""
     
+    KIND = KIND_ANTI_GRAVITY
+    
     def __init__(self, x, y, mass=50):
         super().__init__(x, y, mass)
         self.radius = 20
         self.color = (255, 50, 100)  # Hot pink/magenta
         self.anti_gravity = True
         self.energy_field_radius = 60
+        self.draw_radius = self.energy_field_radius + 2
     
-    def draw(self, screen):
+    def draw(self, screen, now=None):
         """Draw anti-gravity well with energy field effects"""
-        import time
+        if now is None:
+            now = time.time()
+        center = (int(self.position.x), int(self.position.y))
         
         # Draw pulsing energy field
-        pulse = abs(math.sin(time.time() * 4)) * 0.4 + 0.6
+        pulse = abs(math.sin(now * 4)) * 0.4 + 0.6
         
         # Draw multiple energy rings
         for i in range(4):
@@ -287,29 +398,28 @@ class AntiGravityWell(GameObject):
             ring_color = (int(255 * ring_intensity), 
                          int(100 * ring_intensity), 
                          int(150 * ring_intensity))
-            pygame.draw.circle(screen, ring_color,
-                              (int(self.position.x), int(self.position.y)),
-                              ring_radius, 2)
+            pygame.draw.circle(screen, ring_color, center, ring_radius, 2)
         
         # Draw repulsion particles
+        sin, circle = math.sin, pygame.draw.circle
+        x, y = self.position.x, self.position.y
+        spin_deg = int(now * 50)
+        wobble = now * 3
+        particle_color = (255, 100, 200)
         for i in range(12):
-            angle = (i * 30 + time.time() * 50) * math.pi / 180
-            distance = 30 + math.sin(time.time() * 3 + i) * 10
-            x_offset = math.cos(angle) * distance
-            y_offset = math.sin(angle) * distance
-            
-            particle_color = (255, 100, 200)
-            pygame.draw.circle(screen, particle_color,
-                              (int(self.position.x + x_offset), int(self.position.y + y_offset)), 2)
+            angle = (i * 30 + spin_deg) % 360
+            distance = 30 + sin(wobble + i) * 10
+            x_offset = COS_DEG[angle] * distance
+            y_offset = SIN_DEG[angle] * distance
+            circle(screen, particle_color, (int(x + x_offset), int(y + y_offset)), 2)
         
         # Draw anti-gravity well core
         super().draw(screen)
         
         # Draw bright pulsing center
-        center_pulse = abs(math.sin(time.time() * 6)) * 0.5 + 0.5
+        center_pulse = abs(math.sin(now * 6)) * 0.5 + 0.5
         center_color = (255, int(255 * center_pulse), int(255 * center_pulse))
-        pygame.draw.circle(screen, center_color,
-                          (int(self.position.x), int(self.position.y)), 8)
+        pygame.draw.circle(screen, center_color, center, 8)
 
 class Goal(GameObject):
     """Level completion target with enhanced visual effects"""
@@ -318,8 +428,14 @@ class Goal(GameObject):
         super().__init__(x, y, mass=0)  # No gravitational effect
         self.radius = 25
         self.color = (0, 255, 100)  # Bright green
+        # Outer ring reaches 1.6x the pulsing radius, which peaks at 1.3x radius
+        self.draw_radius = int(self.radius * 1.3 * 1.6) + 4
         self.pulse_timer = 0
-        self.particles = []  # For particle effects
+        
+        # Particle effects as rows of (x, y, vx, vy, life); the first
+        # particle_count rows are live
+        self.particles = np.zeros((GOAL_MAX_PARTICLES, 5))
+        self.particle_count = 0
     
     def update(self, dt):
         """Animate the goal with particles"""
@@ -328,56 +444,60 @@ class Goal(GameObject):
         self.current_radius = int(self.radius * pulse)
         
         # Update particles
-        import random
         if random.random() < 0.3:  # Add new particles
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.randrange(360)
             speed = random.uniform(10, 30)
-            self.particles.append({
-                'x': self.position.x,
-                'y': self.position.y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 1.0
-            })
-        
-        # Update existing particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['life'] -= dt * 2
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            if self.particle_count < GOAL_MAX_PARTICLES:
+                self.particles[self.particle_count] = (
+                    self.position.x, self.position.y,
+                    COS_DEG[angle] * speed, SIN_DEG[angle] * speed, 1.0
+                )
+                self.particle_count += 1
+        
+        # Update existing particles a column at a time
+        live = self.particles[:self.particle_count]
+        live[:, 0] += live[:, 2] * dt
+        live[:, 1] += live[:, 3] * dt
+        live[:, 4] -= dt * 2
+        
+        # Compact the survivors to the front, keeping their order
+        alive = live[:, 4] > 0
+        if not alive.all():
+            survivors = live[alive]
+            self.particle_count = len(survivors)
+            self.particles[:self.particle_count] = survivors
     
-    def draw(self, screen):
+    def draw(self, screen, now=None):
         """Draw animated goal with particle effects"""
-        import time
+        if now is None:
+            now = time.time()
+        center = (int(self.position.x), int(self.position.y))
         
         # Draw success particles
-        for particle in self.particles:
-            intensity = particle['life']
+        for x, y, _, _, intensity in self.particles[:self.particle_count].tolist():
             color = (0, int(255 * intensity), int(100 * intensity))
-            pygame.draw.circle(screen, color,
-                              (int(particle['x']), int(particle['y'])), 3)
+            pygame.draw.circle(screen, color, (int(x), int(y)), 3)
         
         # Draw multiple pulsing rings
-        pulse_offset = time.time() * 4
+        pulse_offset = now * 4
         for i in range(3):
             ring_pulse = abs(math.sin(pulse_offset + i * 0.5)) * 0.4 + 0.6
             ring_radius = int(self.current_radius * (1 + i * 0.3) * ring_pulse)
             ring_intensity = (3 - i) / 3
             ring_color = (0, int(255 * ring_intensity), int(150 * ring_intensity))
-            pygame.draw.circle(screen, ring_color,
-                              (int(self.position.x), int(self.position.y)),
-                              ring_radius, 3)
+            pygame.draw.circle(screen, ring_color, center, ring_radius, 3)
         
         # Draw bright core
-        pygame.draw.circle(screen, (100, 255, 200),
-                          (int(self.position.x), int(self.position.y)),
-                          self.radius // 2)
-        
-        # Draw ultra-bright center
-        pygame.draw.circle(screen, (255, 255, 255),
-                          (int(self.position.x), int(self.position.y)), 5)
+        self.blit_sprite(screen)
+    
+    def sprite_key(self):
+        """Get the values the goal's pre-rendered core depends on"""
+        return (self.radius,)
+    
+    def render_sprite(self, surface, center):
+        """Draw the bright core and ultra-bright center"""
+        pygame.draw.circle(surface, (100, 255, 200), center, self.radius // 2)
+        pygame.draw.circle(surface, (255, 255, 255), center, 5)
 
 class Obstacle(GameObject):
     """Static obstacle with danger visual effects"""
@@ -387,13 +507,16 @@ class Obstacle(GameObject):
         self.radius = radius
         self.color = (255, 0, 50)  # Bright red
         self.warning_radius = radius + 8
+        self.draw_radius = int(self.warning_radius * 1.4) + 2
     
-    def draw(self, screen):
+    def draw(self, screen, now=None):
         """Draw obstacle with warning effects"""
-        import time
+        if now is None:
+            now = time.time()
+        center = (int(self.position.x), int(self.position.y))
         
         # Draw pulsing danger field
-        pulse = abs(math.sin(time.time() * 5)) * 0.5 + 0.5
+        pulse = abs(math.sin(now * 5)) * 0.5 + 0.5
         warning_color = (int(255 * pulse), 0, int(100 * pulse))
         
         # Draw multiple warning rings
@@ -401,14 +524,12 @@ class Obstacle(GameObject):
             ring_radius = int(self.warning_radius * (1 + i * 0.2) * pulse)
             ring_intensity = (3 - i) / 3 * pulse
             color = (int(255 * ring_intensity), 0, int(50 * ring_intensity))
-            pygame.draw.circle(screen, color,
-                              (int(self.position.x), int(self.position.y)),
-                              ring_radius, 2)
-        
-        # Draw obstacle core
-        super().draw(screen)
+            pygame.draw.circle(screen, color, center, ring_radius, 2)
         
-        # Draw danger center
-        pygame.draw.circle(screen, (255, 100, 100),
-                          (int(self.position.x), int(self.position.y)),
-                          self.radius - 3)
+        # Draw obstacle core and danger center
+        self.blit_sprite(screen)
+    
+    def render_sprite(self, surface, center):
+        """Draw the obstacle core and danger center"""
+        super().render_sprite(surface, center)
+        pygame.draw.circle(surface, (255, 100, 100), center, self.radius - 3)
@@ -8,6 +8,8 @@ import math
 class Vector2D:
     """2D Vector class for position and velocity calculations"""
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x=0.0, y=0.0):
         self.x = float(x)
         self.y = float(y)
@@ -27,12 +29,22 @@ class Vector2D:
     def magnitude(self):
         return math.sqrt(self.x**2 + self.y**2)
     
+    def magnitude_sq(self):
+        """Squared length - use for distance comparisons to skip the sqrt"""
+        return self.x * self.x + self.y * self.y
+    
     def normalize(self):
         mag = self.magnitude()
         if mag > 0:
             return Vector2D(self.x / mag, self.y / mag)
         return Vector2D(0, 0)
     
+    def set(self, x, y):
+        """Update this vector in place, avoiding a new allocation"""
+        self.x = float(x)
+        self.y = float(y)
+        return self
+    
     def to_tuple(self):
         return (self.x, self.y)
 
@@ -46,72 +58,95 @@ class PhysicsEngine:
     def calculate_gravity_force(self, obj1_pos, obj1_mass, obj2_pos, obj2_mass):
         """Calculate gravitational force between two objects"""
         # Vector from obj1 to obj2
-        direction = obj2_pos - obj1_pos
-        distance = direction.magnitude()
+        dx = obj2_pos.x - obj1_pos.x
+        dy = obj2_pos.y - obj1_pos.y
+        distance_sq = dx * dx + dy * dy
         
         # Avoid division by zero and extremely close objects
-        if distance < 5:
+        if distance_sq < 25:
             return Vector2D(0, 0)
         
         # Don't calculate gravity for very distant objects
-        if distance > self.max_gravity_distance:
+        if distance_sq > self.max_gravity_distance * self.max_gravity_distance:
             return Vector2D(0, 0)
         
-        # F = G * m1 * m2 / r^2
-        force_magnitude = (self.gravity_constant * obj1_mass * obj2_mass) / (distance ** 2)
-        force_direction = direction.normalize()
+        # F = G * m1 * m2 / r^2 along d / r, i.e. G * m1 * m2 * d / r^3
+        force_magnitude = self.gravity_constant * obj1_mass * obj2_mass
+        scale = force_magnitude / (distance_sq * math.sqrt(distance_sq))
+        return Vector2D(dx * scale, dy * scale)
+    
+    def gravity_acceleration_np(self, px, py, gx, gy, gm):
+        """Get the (ax, ay) gravitational acceleration at (px, py) from flat source arrays"""
+        # Vector from the object to every source
+        dx = gx - px
+        dy = gy - py
+        r2 = dx * dx + dy * dy
+        
+        # Same near/far cutoffs as calculate_gravity_force
+        in_range = (r2 >= 25) & (r2 <= self.max_gravity_distance ** 2)
         
-        return force_direction * force_magnitude
+        # a = G * m / r^2 along the unit direction, i.e. G * m * d / r^3
+        scale = np.zeros_like(r2)
+        r2_in = r2[in_range]
+        scale[in_range] = self.gravity_constant * gm[in_range] / (r2_in * np.sqrt(r2_in))
+        return (dx * scale).sum(), (dy * scale).sum()
     
-    def calculate_total_gravity(self, position, mass, gravity_sources):
-        """Calculate total gravitational force from all sources"""
-        total_force = Vector2D(0, 0)
+    def update_object_physics_np(self, pos, vel, gx, gy, gm, dt):
+        """Advance an object one Euler step under flat source arrays
         
-        for source in gravity_sources:
-            force = self.calculate_gravity_force(
-                position, mass, 
-                source.position, source.mass
-            )
-            
-            # Handle anti-gravity sources
-            if hasattr(source, 'anti_gravity') and source.anti_gravity:
-                force = force * -1
-            
-            total_force = total_force + force
+        pos and vel are (x, y) pairs; gx, gy and gm are parallel (N,) arrays
+        of source positions and masses, negative for anti-gravity.
+        Returns the new (pos, vel) pairs.
+        """
+        ax, ay = self.gravity_acceleration_np(pos[0], pos[1], gx, gy, gm)
         
-        return total_force
+        # Update velocity (Euler integration), then position
+        vx = vel[0] + ax * dt
+        vy = vel[1] + ay * dt
+        return (pos[0] + vx * dt, pos[1] + vy * dt), (vx, vy)
     
-    def update_object_physics(self, obj, gravity_sources, dt):
-        """Update an object's position and velocity based on physics"""
-        # Calculate gravitational acceleration
-        gravity_force = self.calculate_total_gravity(obj.position, obj.mass, gravity_sources)
-        acceleration = gravity_force / obj.mass
+    def predict_trajectory_np(self, pos, vel, gx, gy, gm, dt, bounds,
+                              steps, stride, out):
+        """Predict a trajectory for visualization under flat source arrays
         
-        # Update velocity (Euler integration)
-        obj.velocity = obj.velocity + acceleration * dt
+        Writes every stride-th point into the out buffer and returns the
+        number of steps taken; prediction stops once the path leaves bounds,
+        given as (min_x, min_y, max_x, max_y). Integrates with velocity
+        Verlet, like predict_trajectory_jit.
+        """
+        min_x, min_y, max_x, max_y = bounds
+        max_d2 = self.max_gravity_distance ** 2
+        g_mass = self.gravity_constant * gm
+        half_dt = 0.5 * dt
+        px, py = pos
+        vx, vy = vel
+        count = 0
         
-        # Update position
-        obj.position = obj.position + obj.velocity * dt
-    
-    def predict_trajectory(self, start_pos, start_vel, mass, gravity_sources, steps=100, dt=0.1):
-        """Predict trajectory for visualization"""
-        trajectory = []
-        pos = Vector2D(start_pos.x, start_pos.y)
-        vel = Vector2D(start_vel.x, start_vel.y)
+        def acceleration(px, py):
+            """Acceleration from every in-range source as one vectorized sum"""
+            dx = gx - px
+            dy = gy - py
+            r2 = dx * dx + dy * dy
+            in_range = (r2 >= 25) & (r2 <= max_d2)
+            scale = g_mass / np.where(in_range, r2 * np.sqrt(r2), np.inf)
+            return (dx * scale).sum(), (dy * scale).sum()
         
-        for _ in range(steps):
-            trajectory.append((pos.x, pos.y))
-            
-            # Calculate forces
-            gravity_force = self.calculate_total_gravity(pos, mass, gravity_sources)
-            acceleration = gravity_force / mass
+        ax, ay = acceleration(px, py)
+        for step in range(steps):
+            if step % stride == 0:
+                out[step // stride] = (px, py)
+            count += 1
             
-            # Update
-            vel = vel + acceleration * dt
-            pos = pos + vel * dt
+            # Move with the current acceleration, then average it with the new one
+            px += (vx + ax * half_dt) * dt
+            py += (vy + ay * half_dt) * dt
+            new_ax, new_ay = acceleration(px, py)
+            vx += (ax + new_ax) * half_dt
+            vy += (ay + new_ay) * half_dt
+            ax, ay = new_ax, new_ay
             
-            # Stop prediction if object goes too far off screen
-            if pos.x < -500 or pos.x > 1500 or pos.y < -500 or pos.y > 1200:
+            # Stop prediction once the path leaves the bounds
+            if px < min_x or px > max_x or py < min_y or py > max_y:
                 break
         
-        return trajectory
+        return count
@@ -0,0 +1,79 @@
+"""
+Quadtree over static circles for broad-phase collision queries
+"""
+
+
+class Quadtree:
+    """Region quadtree storing items by the bounding boxes of their circles
+
+    Items live in the smallest node whose region fully holds their box, so
+    ones straddling a split stay in the parent. Leaves split once they hold
+    more than max_items, down to max_depth.
+    """
+
+    def __init__(self, min_x, min_y, max_x, max_y, max_items=4, max_depth=8):
+        self.bounds = (min_x, min_y, max_x, max_y)
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.items = []  # (item, min_x, min_y, max_x, max_y)
+        self.children = None
+
+    def insert(self, item, x, y, r):
+        """Insert an item covering the circle at (x, y) with radius r"""
+        self._insert((item, x - r, y - r, x + r, y + r))
+
+    def _insert(self, entry):
+        if self.children is not None:
+            child = self._child_for(entry)
+            if child is not None:
+                child._insert(entry)
+                return
+
+        self.items.append(entry)
+        if self.children is None and len(self.items) > self.max_items and self.max_depth > 0:
+            self._split()
+
+    def _split(self):
+        """Divide this leaf into four quadrants and push its items down"""
+        min_x, min_y, max_x, max_y = self.bounds
+        mid_x = (min_x + max_x) / 2
+        mid_y = (min_y + max_y) / 2
+        depth = self.max_depth - 1
+        self.children = [
+            Quadtree(min_x, min_y, mid_x, mid_y, self.max_items, depth),
+            Quadtree(mid_x, min_y, max_x, mid_y, self.max_items, depth),
+            Quadtree(min_x, mid_y, mid_x, max_y, self.max_items, depth),
+            Quadtree(mid_x, mid_y, max_x, max_y, self.max_items, depth),
+        ]
+
+        entries = self.items
+        self.items = []
+        for entry in entries:
+            self._insert(entry)
+
+    def _child_for(self, entry):
+        """Get the child quadrant fully holding an entry's box, if any"""
+        _, left, top, right, bottom = entry
+        for child in self.children:
+            min_x, min_y, max_x, max_y = child.bounds
+            if left >= min_x and top >= min_y and right <= max_x and bottom <= max_y:
+                return child
+        return None
+
+    def query(self, x, y, r=0):
+        """Get the items whose boxes overlap the box of the circle at (x, y)"""
+        found = []
+        left, top, right, bottom = x - r, y - r, x + r, y + r
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            min_x, min_y, max_x, max_y = node.bounds
+            if left > max_x or right < min_x or top > max_y or bottom < min_y:
+                continue
+
+            for item, i_left, i_top, i_right, i_bottom in node.items:
+                if left <= i_right and right >= i_left and top <= i_bottom and bottom >= i_top:
+                    found.append(item)
+            if node.children is not None:
+                stack.extend(node.children)
+        return found
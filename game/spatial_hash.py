@@ -0,0 +1,41 @@
+"""
+Uniform spatial hash grid for finding the gravity sources near a point
+"""
+
+import math
+
+
+class SpatialHashGrid:
+    """Buckets items by the grid cells their bounding boxes overlap"""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cell_range(self, x, y, r):
+        """Get the (min_cx, min_cy, max_cx, max_cy) cells covering a circle's AABB"""
+        size = self.cell_size
+        return (math.floor((x - r) / size), math.floor((y - r) / size),
+                math.floor((x + r) / size), math.floor((y + r) / size))
+
+    def insert(self, item, x, y, r):
+        """Insert an item covering the circle at (x, y) with radius r"""
+        min_cx, min_cy, max_cx, max_cy = self.cell_range(x, y, r)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                self.cells.setdefault((cx, cy), []).append(item)
+
+    def query(self, x, y, r=0):
+        """Get the set of items sharing a cell with the circle at (x, y)"""
+        min_cx, min_cy, max_cx, max_cy = self.cell_range(x, y, r)
+        cells = self.cells
+
+        # Common case: the query fits in a single cell
+        if min_cx == max_cx and min_cy == max_cy:
+            return set(cells.get((min_cx, min_cy), ()))
+
+        found = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                found.update(cells.get((cx, cy), ()))
+        return found
@@ -0,0 +1,70 @@
+"""
+Tests for level loading
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from game.level import Level, LevelManager
+
+
+class MalformedLevelTest(unittest.TestCase):
+    """Malformed level files are replaced by a stand-in instead of crashing"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": os.path.join(self.tmp.name, "cache")})
+        env.start()
+        self.addCleanup(env.stop)
+
+        os.makedirs("levels")
+        self.write_level("level_01.json", {
+            "name": "Good",
+            "spaceship_start": {"x": 100, "y": 300},
+            "objects": [{"type": "goal", "x": 700, "y": 300}]
+        })
+        self.write_level("level_02.json", {"name": "No y", "spaceship_start": {"x": 100}})
+        self.write_level("level_03.json", [{"name": "Not an object"}])
+
+    def write_level(self, filename, data):
+        with open(os.path.join("levels", filename), 'w') as f:
+            json.dump(data, f)
+
+    def load_levels(self):
+        """Load every level, returning them with the printed output"""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            manager = LevelManager()
+            levels = [manager.get_level(i) for i in range(len(manager.levels))]
+        return levels, output.getvalue()
+
+    def test_bad_levels_get_a_stand_in(self):
+        levels, output = self.load_levels()
+
+        self.assertEqual(len(levels), 3)
+        self.assertTrue(all(isinstance(level, Level) for level in levels))
+        self.assertEqual(levels[0].name, "Good")
+        self.assertEqual(levels[1].name, "Tutorial")
+        self.assertEqual(levels[2].name, "Tutorial")
+        self.assertIn("Error loading level level_02.json", output)
+        self.assertIn("Error loading level level_03.json", output)
+
+    def test_bad_levels_get_a_stand_in_from_the_pack(self):
+        self.load_levels()
+        levels, output = self.load_levels()
+
+        self.assertEqual([level.name for level in levels], ["Good", "Tutorial", "Tutorial"])
+        self.assertIn("Error loading level level_02.json", output)
+
+
+if __name__ == "__main__":
+    unittest.main()